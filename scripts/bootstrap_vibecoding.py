@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""Skill bank installer: plans the whole install up front, then runs it in parallel.
+
+Same semantics as bootstrap_vibecoding.sh: bootstrap.config, then bootstrap.config.local,
+then CLI flags; `common` is always installed; skills land in <base>/<TARGET_SUBPATH>/<name>.
+The plan is a manifest of (src, dst, mode) operations executed by a thread pool, with
+parent directories created once per batch instead of once per skill.
+
+Each target gets an install manifest (<base>/.skill-bank/<target>.json, outside the
+skills directory) with the content hash of every installed skill. Re-runs leave
+up-to-date skills untouched, copy only changed files and remove skills that are no
+longer selected.
+
+`--mode clone` places files as reflinks (copy-on-write clones) where the target
+filesystem supports them and as hardlinks otherwise, for tools that do not follow
+symlinks. Capability is probed once per (source, target) filesystem pair.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from skill_index import find_skill, load_index
+from skill_index import skill_dirs as index_skill_dirs
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+BOOTSTRAP_CONFIG = REPO_ROOT / "bootstrap.config"
+BOOTSTRAP_LOCAL = REPO_ROOT / "bootstrap.config.local"
+
+ALL_CATEGORIES = ["langgraph", "llm", "frontend", "backend", "platform"]
+ALL_TARGETS = ["claude", "codex", "cursor", "windsurf", "cline", "aider", "roo", "kilocode", "opencode"]
+# common is always installed — it contains always-on guardrail skills
+MANDATORY_CATEGORIES = ["common"]
+
+# Per-target: relative subpath under base (base = $HOME or custom *_PATH).
+TARGET_SUBPATH = {
+    "claude": ".claude/skills",
+    "codex": ".agents/skills",
+    "cursor": ".cursor/skills",
+    "windsurf": ".codeium/windsurf/memories",
+    "roo": ".roo/skills",
+    "kilocode": ".kilocode/skills",
+    "opencode": ".config/opencode/skills",
+}
+PATH_KEYS = {
+    "claude": "CLAUDE_PATH",
+    "codex": "CODEX_PATH",
+    "cursor": "CURSOR_PATH",
+    "windsurf": "WINDSURF_PATH",
+    "roo": "ROO_PATH",
+    "kilocode": "KILO_PATH",
+    "opencode": "OPENCODE_PATH",
+}
+TARGET_TITLES = {
+    "claude": "Claude Code",
+    "codex": "OpenAI Codex",
+    "cursor": "Cursor",
+    "roo": "Roo Code",
+    "kilocode": "Kilo Code",
+    "opencode": "Open Code",
+    "windsurf": "Windsurf",
+    "cline": "Cline",
+    "aider": "Aider",
+}
+SUMMARY_LABELS = {
+    "claude": "Claude",
+    "codex": "Codex",
+    "cursor": "Cursor",
+    "roo": "Roo",
+    "kilocode": "Kilo",
+    "opencode": "OpenCode",
+    "windsurf": "Windsurf",
+}
+# Targets that receive skill directories (and an install manifest).
+SKILL_TARGETS = ["claude", "codex", "cursor", "roo", "kilocode", "opencode"]
+# Install order matches the historical shell script.
+TARGET_ORDER = ["claude", "codex", "cursor", "roo", "kilocode", "opencode", "windsurf", "cline", "aider"]
+CONFIG_KEYS = ("CATEGORIES", "TARGETS", "SKILLS_EXTRA", *PATH_KEYS.values())
+
+CODEX_INSTRUCTIONS = "# Codex — skills from skill bank\nSkills: ~/.agents/skills/<name>/\nList: ls ~/.agents/skills/\n"
+MANIFEST_DIR = ".skill-bank"
+# Older installers kept the manifest inside the skills directory; read once, then removed.
+LEGACY_MANIFEST_NAME = ".skill-bank-manifest.json"
+MANIFEST_VERSION = 1
+MODES = ("symlink", "copy", "clone")
+FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, xfs, ...)
+
+
+@dataclass(frozen=True)
+class Operation:
+    src: Path | None
+    dst: Path
+    mode: str  # link | copy | sync | remove | file | unlink | write
+    content: str | None = None
+    # copy/sync: source files as {relpath: [size, mtime_ns, sha256]}; sync: files of the last install
+    files: dict[str, list] | None = field(default=None, compare=False)
+    previous: dict[str, list] | None = field(default=None, compare=False)
+    method: str = field(default="copy", compare=False)  # copy | clone
+
+
+@dataclass
+class TargetPlan:
+    target: str
+    dest: Path | None
+    operations: list[Operation] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    manifest: dict[str, dict] | None = None
+    manifest_path: Path | None = None
+    unchanged: int = 0
+    deduplicated: int = 0
+
+
+def read_config(path: Path, config: dict[str, str]) -> None:
+    if not path.is_file():
+        return
+    for line in path.read_text().splitlines():
+        if line.startswith("#") or not line.strip():
+            continue
+        key, sep, value = line.partition("=")
+        if sep and key in CONFIG_KEYS:
+            config[key] = value.replace('"', "")
+
+
+def load_config() -> dict[str, str]:
+    config = {key: "" for key in CONFIG_KEYS}
+    read_config(BOOTSTRAP_CONFIG, config)
+    read_config(BOOTSTRAP_LOCAL, config)
+    return config
+
+
+def resolve_names(value: str, all_names: list[str]) -> list[str]:
+    names = value.split()
+    return list(all_names) if not names or names == ["all"] else names
+
+
+def with_mandatory(categories: list[str]) -> list[str]:
+    return categories + [c for c in MANDATORY_CATEGORIES if c not in categories]
+
+
+def base_for(target: str, config: dict[str, str]) -> Path:
+    key = PATH_KEYS.get(target)
+    value = config.get(key, "") if key else ""
+    return Path(value) if value else Path.home()
+
+
+def collect_skills(skills_dir: Path, categories: list[str], extra: list[str]) -> list[Path]:
+    index = load_index(skills_dir)
+    skill_dirs: list[Path] = []
+    for category in categories:
+        skill_dirs.extend(index_skill_dirs(index, skills_dir, category))
+
+    for name in extra:
+        entries = find_skill(index, name)
+        if not entries:
+            print(f"[WARN] SKILLS_EXTRA skill not found: {name}")
+            continue
+        if len(entries) > 1:
+            paths = ", ".join(e["path"] for e in entries)
+            print(f"[WARN] SKILLS_EXTRA skill {name!r} is ambiguous ({paths}); using {entries[0]['path']}")
+        skill_dirs.append(skills_dir / entries[0]["path"])
+
+    # Dedupe by skill name (same name might appear from category + extra)
+    seen: dict[str, Path] = {}
+    deduped = []
+    for skill_dir in skill_dirs:
+        if skill_dir.name not in seen:
+            seen[skill_dir.name] = skill_dir
+            deduped.append(skill_dir)
+        elif seen[skill_dir.name] != skill_dir:
+            print(f"[WARN] Skipping {skill_dir}: skill name already taken by {seen[skill_dir.name]}")
+    return deduped
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_tree(root: Path, known: dict[str, list]) -> dict[str, list]:
+    """Map each file under root to [size, mtime_ns, sha256].
+
+    Files whose size and mtime match `known` reuse the recorded hash (rsync-style quick check).
+    """
+    files: dict[str, list] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            path = Path(dirpath) / name
+            rel = path.relative_to(root).as_posix()
+            stat = path.stat()
+            old = known.get(rel)
+            if old and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+                files[rel] = old
+            else:
+                files[rel] = [stat.st_size, stat.st_mtime_ns, hash_file(path)]
+    return dict(sorted(files.items()))
+
+
+def tree_hash(files: dict[str, list]) -> str:
+    digest = hashlib.sha256()
+    for rel, record in files.items():
+        digest.update(f"{rel}\0{record[2]}\n".encode())
+    return digest.hexdigest()
+
+
+def manifest_path(target: str, config: dict[str, str]) -> Path:
+    return base_for(target, config) / MANIFEST_DIR / f"{target}.json"
+
+
+def load_manifest(path: Path, dest: Path | None = None) -> dict[str, dict]:
+    """Read an install manifest; with `dest`, fall back to the legacy one inside it."""
+    for candidate in (path, dest / LEGACY_MANIFEST_NAME if dest is not None else None):
+        if candidate is None:
+            continue
+        try:
+            data = json.loads(candidate.read_text())
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            return data.get("skills", {})
+    return {}
+
+
+def save_manifest(path: Path, skills: dict[str, dict], dest: Path | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "skills": skills}, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+    if dest is not None:
+        (dest / LEGACY_MANIFEST_NAME).unlink(missing_ok=True)
+
+
+def plan_skills(plan: TargetPlan, skills: list[Path], mode: str, manifest: dict, scans: dict) -> None:
+    assert plan.dest is not None
+    plan.manifest = {}
+    for skill in skills:
+        dst = plan.dest / skill.name
+        previous = manifest.get(skill.name) or {}
+        if mode in ("copy", "clone"):
+            files = scans[skill]
+            entry = {"mode": mode, "src": str(skill), "hash": tree_hash(files), "files": files}
+            installed = previous.get("mode") == mode and dst.is_dir() and not dst.is_symlink()
+            if installed and previous.get("hash") == entry["hash"]:
+                plan.unchanged += 1
+            elif installed:
+                old_files = previous.get("files", {})
+                plan.operations.append(Operation(skill, dst, "sync", files=files, previous=old_files, method=mode))
+            else:
+                plan.operations.append(Operation(skill, dst, "copy", files=files, method=mode))
+        else:
+            entry = {"mode": "link", "src": str(skill)}
+            if dst.is_symlink() and os.readlink(dst) == str(skill):
+                plan.unchanged += 1
+            else:
+                plan.operations.append(Operation(skill, dst, "link"))
+        plan.manifest[skill.name] = entry
+
+    # Deselected skills: remove only what a previous install recorded and still looks like ours.
+    for name, entry in sorted(manifest.items()):
+        dst = plan.dest / name
+        if name in plan.manifest:
+            continue
+        ours = dst.is_symlink() if entry.get("mode") == "link" else (dst.is_dir() and not dst.is_symlink())
+        if ours:
+            plan.operations.append(Operation(None, dst, "remove"))
+
+
+def plan_target(
+    target: str,
+    skills: list[Path],
+    mode: str,
+    config: dict[str, str],
+    manifest: dict[str, dict],
+    scans: dict[Path, dict[str, list]],
+) -> TargetPlan:
+    base = base_for(target, config)
+
+    if target == "cline":
+        return TargetPlan(target, None, notes=["[ok]   Skills in ~/.cursor/skills/ (or open this repo in Cline)."])
+    if target == "aider":
+        return TargetPlan(target, None, notes=["[ok]   Skills in ~/.agents/skills/ or repo skills/; use as needed."])
+    if target == "windsurf":
+        dest = base / TARGET_SUBPATH[target]
+        if not ((base / ".codeium").is_dir() or base == Path.home()):
+            return TargetPlan(target, None, notes=[f"[skip] .codeium not found under {base}"])
+        rules = REPO_ROOT / ".windsurfrules"
+        if not rules.is_file():
+            return TargetPlan(target, None, notes=[f"[skip] {rules} not found"])
+        memory = dest / "skills_for_llm_projects.md"
+        return TargetPlan(target, memory, [Operation(rules, memory, "file")])
+
+    dest = base / TARGET_SUBPATH[target]
+    plan = TargetPlan(target, dest, manifest_path=manifest_path(target, config))
+    if target == "claude" and (dest / "skills_for_llm_projects").is_symlink():
+        plan.operations.append(Operation(None, dest / "skills_for_llm_projects", "unlink"))
+        plan.notes.append("[rm]   legacy symlink")
+    plan_skills(plan, skills, mode, manifest, scans)
+
+    # Claude commands / Codex instructions only when global (default path)
+    if target == "claude" and not config.get("CLAUDE_PATH"):
+        cmds_dir = Path.home() / ".claude" / "commands"
+        for cmd_file in sorted((REPO_ROOT / ".claude" / "commands").glob("*.md")):
+            cmd_dst = cmds_dir / cmd_file.name
+            if mode != "symlink":
+                plan.operations.append(Operation(cmd_file, cmd_dst, "file"))
+            elif not (cmd_dst.is_symlink() and os.readlink(cmd_dst) == str(cmd_file)):
+                plan.operations.append(Operation(cmd_file, cmd_dst, "link"))
+    if target == "codex" and not config.get("CODEX_PATH"):
+        instructions = Path.home() / ".codex" / "instructions.md"
+        if not instructions.is_file():
+            plan.operations.append(Operation(None, instructions, "write", CODEX_INSTRUCTIONS))
+    return plan
+
+
+def plan_install(
+    skills: list[Path], targets: list[str], mode: str, config: dict[str, str], jobs: int = 1
+) -> list[TargetPlan]:
+    wanted = [t for t in TARGET_ORDER if t in targets]
+    manifests = {
+        t: load_manifest(manifest_path(t, config), base_for(t, config) / TARGET_SUBPATH[t])
+        for t in wanted
+        if t in SKILL_TARGETS
+    }
+
+    scans: dict[Path, dict[str, list]] = {}
+    if mode in ("copy", "clone"):
+        # Source stats/hashes recorded by any target let unchanged files skip re-hashing.
+        known: dict[str, dict[str, list]] = {}
+        for manifest in manifests.values():
+            for entry in manifest.values():
+                if entry.get("files"):
+                    known.setdefault(entry["src"], entry["files"])
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            scanned = pool.map(lambda skill: scan_tree(skill, known.get(str(skill), {})), skills)
+            scans = dict(zip(skills, scanned))
+
+    return [plan_target(t, skills, mode, config, manifests.get(t, {}), scans) for t in wanted]
+
+
+def remove_path(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+_clone_methods: dict[tuple[int, int], str] = {}
+_clone_lock = threading.Lock()
+
+
+def reflink(src: Path, dst: Path) -> None:
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    with src.open("rb") as source, dst.open("wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            target.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+
+
+def clone_method(src_dir: Path, dst_dir: Path) -> str:
+    """Return reflink, hardlink or copy for this filesystem pair; probed once and cached."""
+    key = (src_dir.stat().st_dev, dst_dir.stat().st_dev)
+    with _clone_lock:
+        if key not in _clone_methods:
+            probe_src = next((p for p in src_dir.rglob("*") if p.is_file()), None)
+            probe_dst = dst_dir / f".skill-bank-probe-{os.getpid()}"
+            method = "hardlink" if key[0] == key[1] else "copy"
+            if probe_src is not None:
+                try:
+                    reflink(probe_src, probe_dst)
+                    method = "reflink"
+                except OSError:
+                    pass
+                finally:
+                    probe_dst.unlink(missing_ok=True)
+            _clone_methods[key] = method
+        return _clone_methods[key]
+
+
+def place_file(src: Path, dst: Path, method: str) -> int:
+    """Create dst from src; returns the number of bytes shared with src instead of copied."""
+    if method == "reflink":
+        reflink(src, dst)
+        return dst.stat().st_size
+    if method == "hardlink":
+        os.link(src, dst)
+        return dst.stat().st_size
+    shutil.copy2(src, dst)
+    return 0
+
+
+def sync_tree(src: Path, dst: Path, files: dict[str, list], previous: dict[str, list], method: str = "copy") -> int:
+    """Copy files that differ from the previous install and delete files that disappeared.
+
+    Returns the number of bytes deduplicated (reflinked or hardlinked) rather than copied.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    place = clone_method(src, dst) if method == "clone" else "copy"
+    made = {dst}
+    deduplicated = 0
+    for rel, (size, _, sha) in files.items():
+        target = dst / rel
+        old = previous.get(rel)
+        if old and old[2] == sha and target.is_file() and target.stat().st_size == size:
+            continue
+        if target.parent not in made:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            made.add(target.parent)
+        # Never write through an existing hardlink: that would modify the source file.
+        target.unlink(missing_ok=True)
+        deduplicated += place_file(src / rel, target, place)
+    for rel in sorted(previous.keys() - files.keys(), reverse=True):
+        stale = dst / rel
+        stale.unlink(missing_ok=True)
+        for parent in stale.parents:
+            if parent == dst or any(parent.iterdir()):
+                break
+            parent.rmdir()
+    return deduplicated
+
+
+def apply_operation(op: Operation) -> int:
+    """Apply one operation; returns bytes deduplicated (clone mode), otherwise 0."""
+    if op.mode == "unlink":
+        op.dst.unlink(missing_ok=True)
+    elif op.mode == "link":
+        if op.dst.is_symlink() and os.readlink(op.dst) == str(op.src):
+            return 0
+        remove_path(op.dst)
+        op.dst.symlink_to(op.src, target_is_directory=op.src.is_dir())
+    elif op.mode == "copy":
+        remove_path(op.dst)
+        return sync_tree(op.src, op.dst, op.files or {}, {}, op.method)
+    elif op.mode == "sync":
+        return sync_tree(op.src, op.dst, op.files or {}, op.previous or {}, op.method)
+    elif op.mode == "remove":
+        remove_path(op.dst)
+    elif op.mode == "file":
+        if op.dst.is_symlink():
+            op.dst.unlink()
+        shutil.copyfile(op.src, op.dst)
+    elif op.mode == "write":
+        op.dst.write_text(op.content or "")
+    else:
+        raise ValueError(f"Unknown operation mode: {op.mode}")
+    return 0
+
+
+def execute(plans: list[TargetPlan], jobs: int) -> list[str]:
+    """Run all operations, then record per-target install manifests. Returns error messages."""
+    operations = [op for plan in plans for op in plan.operations]
+    # Batch directory creation: one mkdir per distinct parent, not one per operation.
+    for parent in sorted({op.dst.parent for op in operations}):
+        parent.mkdir(parents=True, exist_ok=True)
+    for plan in plans:
+        if plan.dest is not None and plan.target != "windsurf":
+            plan.dest.mkdir(parents=True, exist_ok=True)
+
+    def run(op: Operation) -> tuple[int, str | None]:
+        try:
+            return apply_operation(op), None
+        except OSError as exc:
+            return 0, f"{op.mode} {op.dst}: {exc}"
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        outcomes = list(pool.map(run, operations))
+
+    failures = [(op, error) for op, (_, error) in zip(operations, outcomes) if error]
+    deduplicated = {op.dst: shared for op, (shared, _) in zip(operations, outcomes)}
+    for plan in plans:
+        plan.deduplicated = sum(deduplicated[op.dst] for op in plan.operations)
+
+    failed = {op.dst for op, _ in failures}
+    for plan in plans:
+        if plan.manifest is None or plan.manifest_path is None or plan.dest is None:
+            continue
+        previous = load_manifest(plan.manifest_path, plan.dest)
+        skills = {name: entry for name, entry in plan.manifest.items() if plan.dest / name not in failed}
+        # A failed removal stays recorded so the next run retries it.
+        for name, entry in previous.items():
+            if name not in plan.manifest and plan.dest / name in failed:
+                skills[name] = entry
+        save_manifest(plan.manifest_path, skills, plan.dest)
+    return [error for _, error in failures]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            f"Config: {BOOTSTRAP_CONFIG} (optional: {BOOTSTRAP_LOCAL})\n"
+            "  CATEGORIES, TARGETS, SKILLS_EXTRA; CLAUDE_PATH, CURSOR_PATH, ... (empty = use ~)"
+        ),
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="symlink",
+        help="symlink (default), copy, or clone: reflink where supported, hardlink otherwise",
+    )
+    parser.add_argument("--copy", dest="mode", action="store_const", const="copy", help="Same as --mode copy")
+    parser.add_argument("--categories", help="Comma-separated categories (overrides config)")
+    parser.add_argument("--targets", help="Comma-separated targets (overrides config)")
+    for target in ALL_TARGETS:
+        parser.add_argument(f"--{target}", dest="extra_targets", action="append_const", const=target)
+    parser.add_argument("--jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4), help="Worker threads")
+    parser.add_argument("--dry-run", action="store_true", help="Print the planned operations and exit")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print one line per operation")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    config = load_config()
+    mode = args.mode
+
+    categories = with_mandatory(resolve_names(config["CATEGORIES"], ALL_CATEGORIES))
+    targets = resolve_names(config["TARGETS"], ALL_TARGETS)
+    if args.categories:
+        categories = args.categories.replace(",", " ").split()
+    if args.targets:
+        targets = args.targets.replace(",", " ").split()
+    targets += args.extra_targets or []
+    # Always re-inject mandatory categories after CLI may have overridden them
+    categories = with_mandatory(categories)
+
+    if not SKILLS_DIR.is_dir():
+        print(f"[ERROR] skills directory not found: {SKILLS_DIR}")
+        return 1
+    extra = config["SKILLS_EXTRA"].split()
+    skills = collect_skills(SKILLS_DIR, categories, extra)
+    if not skills:
+        print(f"[ERROR] No skills found (categories: {' '.join(categories)}; SKILLS_EXTRA: {' '.join(extra)})")
+        return 1
+
+    plans = plan_install(skills, targets, mode, config, args.jobs)
+    if args.dry_run:
+        for plan in plans:
+            for op in plan.operations:
+                print(f"{op.mode}\t{op.src or '-'}\t{op.dst}")
+        return 0
+
+    print("")
+    print(f"=== Skill bank bootstrap (mode: {mode}) ===")
+    print(f"  Categories: {' '.join(categories)}  (common always included)")
+    print(f"  Targets: {' '.join(targets)}")
+    print(f"  Skills: {len(skills)}")
+
+    errors = execute(plans, args.jobs)
+
+    for step, plan in enumerate(plans, start=1):
+        print("")
+        print(f"[{step}] {TARGET_TITLES[plan.target]}")
+        for note in plan.notes:
+            print(f"  {note}")
+        counts: dict[str, int] = {}
+        for op in plan.operations:
+            counts[op.mode] = counts.get(op.mode, 0) + 1
+            if args.verbose:
+                print(f"  [{op.mode}] {op.dst}")
+        summary = [f"[{m}] {n}" for m, n in counts.items()] if not args.verbose else []
+        if plan.unchanged:
+            summary.append(f"[ok] {plan.unchanged} up to date")
+        if summary:
+            print("  " + ", ".join(summary))
+        if mode == "clone" and plan.manifest is not None and plan.dest.is_dir():
+            method = clone_method(SKILLS_DIR, plan.dest)
+            print(f"  [clone] {method}: {plan.deduplicated} bytes deduplicated this run")
+        if plan.dest is not None:
+            print(f"  → {plan.dest}")
+
+    if errors:
+        print("")
+        for error in errors:
+            print(f"[ERROR] {error}")
+        return 1
+
+    print("")
+    print("=== Done. Only skills installed (no extra files). ===")
+    print("")
+    for plan in plans:
+        if plan.dest is not None and plan.target in TARGET_SUBPATH:
+            label = f"{SUMMARY_LABELS[plan.target]}:"
+            print(f"  {label:<10}{base_for(plan.target, config) / TARGET_SUBPATH[plan.target]}/")
+    print("")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
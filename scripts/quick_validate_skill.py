@@ -1,38 +1,181 @@
 #!/usr/bin/env python3
-"""Local quick validator for skill frontmatter and naming rules."""
+"""Local quick validator for skill frontmatter and naming rules.
+
+Accepts one or more skill directories, category roots (`skills/llm`) or the skills
+root itself, and can emit a JSON or JUnit-XML report for CI.
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
 import re
-import sys
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Any
 
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024  # Roo/Kilo/Cursor docs
+# A plain YAML scalar cannot contain ": ", so an indented line like this starts a mapping.
+MAPPING_KEY = re.compile(r"""^[^\s#'"-][^:]*:(\s|$)""")
 
 
-def validate_skill(skill_path: Path) -> tuple[bool, str]:
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
+class FrontmatterError(ValueError):
+    """Raised when SKILL.md frontmatter is missing or malformed."""
+
 
-    content = skill_md.read_text()
-    if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
+def read_frontmatter(skill_md: Path) -> dict[str, Any]:
+    """Read frontmatter line by line, stopping at the closing `---`.
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+    The body of SKILL.md after the frontmatter is never read.
+    """
+    with skill_md.open(encoding="utf-8") as handle:
+        first = handle.readline()
+        if not first.startswith("---"):
+            raise FrontmatterError("No YAML frontmatter found")
+        if first.rstrip("\r\n") != "---":
+            raise FrontmatterError("Invalid frontmatter format")
+        lines: list[str] = []
+        for raw_line in handle:
+            line = raw_line.rstrip("\r\n")
+            if line == "---":
+                return parse_frontmatter(lines)
+            lines.append(line)
+    raise FrontmatterError("Invalid frontmatter format")
 
-    frontmatter: dict[str, str] = {}
-    for raw_line in match.group(1).splitlines():
-        line = raw_line.strip()
+
+def parse_frontmatter(lines: list[str]) -> dict[str, Any]:
+    """Parse `key: value` pairs, including multi-line and block scalar values.
+
+    A key with no inline value followed by indented `child: value` lines becomes a
+    nested dict, and one followed by indented `- item` lines becomes a list.
+    """
+    frontmatter: dict[str, Any] = {}
+    index = 0
+    while index < len(lines):
+        line = lines[index].strip()
+        index += 1
         if not line or line.startswith("#"):
             continue
         if ":" not in line:
-            return False, f"Invalid frontmatter line: {line}"
+            raise FrontmatterError(f"Invalid frontmatter line: {line}")
         key, value = line.split(":", 1)
-        frontmatter[key.strip()] = value.strip().strip("\"'")
+
+        # Indented (or blank) lines that follow belong to this key's value; so do
+        # unindented `- item` lines, which YAML allows for a list under a key.
+        block: list[str] = []
+        while index < len(lines) and (
+            not lines[index].strip()
+            or lines[index][:1] in " \t"
+            or (not value.strip() and (lines[index] == "-" or lines[index].startswith("- ")))
+        ):
+            block.append(lines[index])
+            index += 1
+        frontmatter[key.strip()] = _value(value.strip(), block)
+    return frontmatter
+
+
+def _value(value: str, block: list[str]) -> Any:
+    content = [line for line in block if line.strip() and not line.strip().startswith("#")]
+    if value or not content:
+        return _scalar(value, block)
+    indent = min(len(line) - len(line.lstrip()) for line in content)
+    children = [line[indent:] if line.strip() else "" for line in block]
+    first = content[0].strip()
+    if MAPPING_KEY.match(first):
+        return parse_frontmatter(children)
+    if first == "-" or first.startswith("- "):
+        return _sequence(children)
+    return _scalar(value, block)
+
+
+def _sequence(lines: list[str]) -> list[Any]:
+    items: list[Any] = []
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not (line == "-" or line.startswith("- ")):
+            raise FrontmatterError(f"Invalid frontmatter list item: {line.strip()}")
+        block: list[str] = []
+        while index < len(lines) and (not lines[index].strip() or lines[index][:1] in " \t"):
+            block.append(lines[index])
+            index += 1
+        items.append(_scalar(line[1:].strip(), block))
+    return items
+
+
+def _scalar(value: str, block: list[str]) -> str:
+    if value[:1] in ("|", ">"):
+        return _block_scalar(value, block)
+
+    parts = [value, *(line.strip() for line in block)]
+    while parts and not parts[-1]:
+        parts.pop()
+    while parts and not parts[0]:
+        parts.pop(0)
+    text = _fold(parts)
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        quote, text = text[0], text[1:-1]
+        text = text.replace("''", "'") if quote == "'" else text.replace('\\"', '"')
+    return text
+
+
+def _block_scalar(header: str, block: list[str]) -> str:
+    indicators = header[1:].split("#", 1)[0].strip()
+    chomping = "-" if "-" in indicators else "+" if "+" in indicators else ""
+    digits = "".join(ch for ch in indicators if ch.isdigit())
+
+    content = [line for line in block if line.strip()]
+    if digits:
+        indent = int(digits)
+    elif content:
+        indent = min(len(line) - len(line.lstrip()) for line in content)
+    else:
+        indent = 0
+    lines = [line[indent:] if line.strip() else "" for line in block]
+
+    body_lines = list(lines)
+    while body_lines and not body_lines[-1]:
+        body_lines.pop()
+    trailing = len(lines) - len(body_lines)
+    body = "\n".join(body_lines) if header[0] == "|" else _fold(body_lines)
+
+    if not body or chomping == "-":
+        return body
+    if chomping == "+":
+        return body + "\n" * (trailing + 1)
+    return body + "\n"
+
+
+def _fold(lines: list[str]) -> str:
+    """Fold lines YAML-style: single newlines become spaces, blank lines become newlines."""
+    folded = ""
+    pending_space = False
+    for line in lines:
+        if not line:
+            folded += "\n"
+            pending_space = False
+            continue
+        if pending_space:
+            folded += " "
+        folded += line
+        pending_space = True
+    return folded
+
+
+def validate_skill(skill_path: Path) -> tuple[bool, str]:
+    skill_md = skill_path / "SKILL.md"
+    if not skill_md.exists():
+        return False, "SKILL.md not found"
+
+    try:
+        frontmatter = read_frontmatter(skill_md)
+    except FrontmatterError as exc:
+        return False, str(exc)
 
     name = frontmatter.get("name")
     description = frontmatter.get("description")
@@ -62,15 +205,112 @@ def validate_skill(skill_path: Path) -> tuple[bool, str]:
     return True, "Skill is valid!"
 
 
+def collect_skill_dirs(paths: list[Path]) -> list[Path]:
+    """Expand skill directories, category roots and skills roots into skill directories."""
+    found: list[Path] = []
+    for path in paths:
+        if (path / "SKILL.md").exists() or not path.is_dir():
+            candidates = [path]
+        else:
+            candidates = sorted(p.parent for p in path.glob("*/SKILL.md"))
+            candidates = candidates or sorted(p.parent for p in path.glob("*/*/SKILL.md"))
+            candidates = candidates or [path]
+        found.extend(c for c in candidates if c not in found)
+    return found
+
+
+def skill_files(skill_path: Path) -> list[Path]:
+    """Files counted in a skill's total_bytes."""
+    return sorted(p for p in skill_path.rglob("*") if p.is_file() and "__pycache__" not in p.parts)
+
+
+def skill_report(skill_path: Path) -> dict:
+    """Validate one skill and describe the outcome as a report record."""
+    started = time.perf_counter()
+    ok, msg = validate_skill(skill_path)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    skill_md = skill_path / "SKILL.md"
+    files = skill_files(skill_path)
+    return {
+        "name": skill_path.name,
+        "category": skill_path.parent.name,
+        "path": str(skill_path),
+        "status": "passed" if ok else "failed",
+        "message": msg,
+        "skill_md_bytes": skill_md.stat().st_size if skill_md.exists() else 0,
+        "total_bytes": sum(p.stat().st_size for p in files),
+        "duration_ms": round(elapsed_ms, 3),
+    }
+
+
+def render_json(records: list[dict]) -> str:
+    failed = sum(1 for r in records if r["status"] != "passed")
+    summary = {
+        "total": len(records),
+        "passed": len(records) - failed,
+        "failed": failed,
+        "duration_ms": round(sum(r["duration_ms"] for r in records), 3),
+    }
+    return json.dumps({"summary": summary, "skills": records}, indent=2) + "\n"
+
+
+def render_junit(records: list[dict]) -> str:
+    failed = sum(1 for r in records if r["status"] != "passed")
+    suite = ET.Element(
+        "testsuite",
+        name="skills",
+        tests=str(len(records)),
+        failures=str(failed),
+        time=f"{sum(r['duration_ms'] for r in records) / 1000:.6f}",
+    )
+    for record in records:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=f"skills.{record['category']}",
+            name=record["name"],
+            time=f"{record['duration_ms'] / 1000:.6f}",
+        )
+        props = ET.SubElement(case, "properties")
+        for key in ("path", "skill_md_bytes", "total_bytes"):
+            ET.SubElement(props, "property", name=key, value=str(record[key]))
+        if record.get("cached"):
+            ET.SubElement(props, "property", name="cached", value="true")
+        if record["status"] != "passed":
+            ET.SubElement(case, "failure", message=record["message"]).text = record["message"]
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def render_text(records: list[dict]) -> str:
+    if len(records) == 1:
+        return records[0]["message"] + "\n"
+    lines = []
+    for record in records:
+        tag = "ok" if record["status"] == "passed" else "FAIL"
+        lines.append(f"  [{tag}] {record['path']}: {record['message']}")
+    return "\n".join(lines) + "\n"
+
+
+RENDERERS = {"text": render_text, "json": render_json, "junit": render_junit}
+
+
 def main() -> int:
-    if len(sys.argv) != 2:
-        print("Usage: quick_validate_skill.py <skill_directory>")
-        return 1
-
-    path = Path(sys.argv[1])
-    ok, msg = validate_skill(path)
-    print(msg)
-    return 0 if ok else 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+", type=Path, help="Skill directories, category roots or skills root")
+    parser.add_argument("--format", choices=sorted(RENDERERS), default="text", help="Report format")
+    parser.add_argument("--output", type=Path, help="Write the report to a file instead of stdout")
+    args = parser.parse_args()
+
+    records = [skill_report(path) for path in collect_skill_dirs(args.paths)]
+    report = RENDERERS[args.format](records)
+    if args.output:
+        args.output.write_text(report)
+    else:
+        print(report, end="")
+    return 0 if all(r["status"] == "passed" for r in records) else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Build and query skills/index.json: skill path -> category, name, frontmatter, content hash.
+
+The index is refreshed incrementally: every refresh lists `<category>/*/SKILL.md` (a
+directory mtime does not change when SKILL.md is added to an existing skill directory),
+but a SKILL.md is re-parsed only when its mtime or size changed. Skills are keyed by
+`<category>/<name>`, so the same name in two categories is kept twice and reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from quick_validate_skill import FrontmatterError, read_frontmatter
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 3
+
+
+def _entry(skills_dir: Path, skill_md: Path, category: str) -> dict:
+    stat = skill_md.stat()
+    entry = {
+        "category": category,
+        "name": skill_md.parent.name,
+        "path": skill_md.parent.relative_to(skills_dir).as_posix(),
+        "hash": hashlib.sha256(skill_md.read_bytes()).hexdigest(),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "frontmatter": {},
+    }
+    try:
+        entry["frontmatter"] = read_frontmatter(skill_md)
+    except (FrontmatterError, UnicodeDecodeError) as exc:
+        entry["error"] = str(exc)
+    return entry
+
+
+def refresh_index(skills_dir: Path, index: dict) -> tuple[dict, bool]:
+    """Bring an index up to date with the filesystem; returns (index, changed)."""
+    old_skills: dict[str, dict] = index.get("skills", {})
+    categories: list[str] = []
+    skills: dict[str, dict] = {}
+
+    for cat_dir in sorted(d for d in skills_dir.iterdir() if d.is_dir()):
+        category = cat_dir.name
+        categories.append(category)
+        for skill_md in sorted(cat_dir.glob("*/SKILL.md")):
+            try:
+                stat = skill_md.stat()
+            except FileNotFoundError:
+                continue
+            key = f"{category}/{skill_md.parent.name}"
+            old = old_skills.get(key)
+            fresh = old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size
+            skills[key] = old if fresh else _entry(skills_dir, skill_md, category)
+
+    new_index = {"version": INDEX_VERSION, "categories": categories, "skills": skills}
+    return new_index, new_index != index
+
+
+def load_index(skills_dir: Path = SKILLS_DIR, refresh: bool = True) -> dict:
+    """Load skills/index.json, refreshing (and rewriting) it when the tree changed.
+
+    A skills directory that cannot be written to (read-only checkout, permissions) still
+    gets a fresh index; it is just rebuilt in memory on every call.
+    """
+    path = skills_dir / INDEX_NAME
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError):
+        index = {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        index = {}
+    if refresh or not index:
+        index, changed = refresh_index(skills_dir, index)
+        if changed:
+            tmp = path.with_suffix(".tmp")
+            try:
+                tmp.write_text(json.dumps(index, indent=1, sort_keys=True, ensure_ascii=False))
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+    return index
+
+
+def find_skill(index: dict, name: str) -> list[dict]:
+    """Entries for a skill name (or exact `<category>/<name>` path), in category order."""
+    if name in index["skills"]:
+        return [index["skills"][name]]
+    return [e for _, e in sorted(index["skills"].items()) if e["name"] == name]
+
+
+def name_conflicts(index: dict) -> dict[str, list[str]]:
+    """Skill names present in more than one category -> their paths."""
+    paths: dict[str, list[str]] = {}
+    for path, entry in sorted(index["skills"].items()):
+        paths.setdefault(entry["name"], []).append(path)
+    return {name: found for name, found in paths.items() if len(found) > 1}
+
+
+def skill_dirs(index: dict, skills_dir: Path = SKILLS_DIR, category: str | None = None) -> list[Path]:
+    entries = sorted(index["skills"].values(), key=lambda e: e["path"])
+    return [skills_dir / e["path"] for e in entries if category is None or e["category"] == category]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills-dir", type=Path, default=SKILLS_DIR)
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the existing index and rebuild it")
+    parser.add_argument("--query", help="Print the entry for one skill name or <category>/<name> path")
+    parser.add_argument("--category", help="List skills of one category")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        (args.skills_dir / INDEX_NAME).unlink(missing_ok=True)
+    index = load_index(args.skills_dir)
+
+    if args.query:
+        entries = find_skill(index, args.query)
+        if not entries:
+            print(f"[ERROR] Skill not found: {args.query}")
+            return 1
+        print(json.dumps(entries[0] if len(entries) == 1 else entries, indent=2, ensure_ascii=False))
+    elif args.category:
+        for path in skill_dirs(index, args.skills_dir, args.category):
+            print(path.relative_to(args.skills_dir).as_posix())
+    else:
+        for name, paths in name_conflicts(index).items():
+            print(f"[WARN] Skill name {name!r} exists in several categories: {', '.join(paths)}")
+        print(f"Indexed {len(index['skills'])} skills in {len(index['categories'])} categories -> "
+              f"{args.skills_dir / INDEX_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
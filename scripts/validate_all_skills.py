@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Validate every skill in one process: frontmatter rules plus script compilation.
+
+Work is spread over a process pool. Results are cached on disk, keyed by a hash of
+each skill's SKILL.md and Python scripts plus the path and size of every other file,
+so unchanged skills are skipped. `--format json|junit` writes one structured report
+(status, failure reason, byte sizes and validation time per skill) for CI; skills
+served from the cache report 0 ms and are marked cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from quick_validate_skill import RENDERERS, skill_files, skill_report
+from skill_index import load_index, skill_dirs
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "skill_validation.json"
+VALIDATOR_SOURCE = Path(__file__).resolve().parent / "quick_validate_skill.py"
+
+
+def find_skill_dirs(skills_dir: Path) -> list[Path]:
+    return skill_dirs(load_index(skills_dir), skills_dir)
+
+
+def is_source(skill_dir: Path, path: Path) -> bool:
+    return path.suffix == ".py" or path == skill_dir / "SKILL.md"
+
+
+def skill_hash(skill_dir: Path, salt: str) -> str:
+    digest = hashlib.sha256(salt.encode())
+    # The directory name takes part in validation (name must match it).
+    digest.update(skill_dir.name.encode())
+    if not (skill_dir / "SKILL.md").is_file():
+        digest.update(b"\0no SKILL.md")
+    # Sources are validated, so their content counts; other files only show up in the
+    # report's byte sizes, so their size is enough.
+    for path in skill_files(skill_dir):
+        digest.update(path.relative_to(skill_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes() if is_source(skill_dir, path) else str(path.stat().st_size).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def compile_scripts(skill_dir: Path) -> tuple[bool, str]:
+    for path in sorted(skill_dir.rglob("*.py")):
+        try:
+            compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+        except SyntaxError as exc:
+            return False, f"{path.relative_to(skill_dir)}:{exc.lineno}: {exc.msg}"
+    return True, "Skill is valid!"
+
+
+def check_skill(skill_dir: Path) -> dict:
+    record = skill_report(skill_dir)
+    if record["status"] == "passed":
+        started = time.perf_counter()
+        ok, msg = compile_scripts(skill_dir)
+        record["duration_ms"] = round(record["duration_ms"] + (time.perf_counter() - started) * 1000, 3)
+        record["status"], record["message"] = ("passed" if ok else "failed"), msg
+    return record
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(path: Path, cache: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills-dir", type=Path, default=SKILLS_DIR)
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="Validation cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every skill, ignore the cache")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--format", choices=sorted(RENDERERS), help="Also emit a structured report")
+    parser.add_argument("--output", type=Path, help="Report file (default: stdout, progress lines suppressed)")
+    args = parser.parse_args()
+
+    skill_dirs = find_skill_dirs(args.skills_dir)
+    if not skill_dirs:
+        print(f"[ERROR] No skills found under {args.skills_dir}")
+        return 1
+
+    salt = hashlib.sha256(VALIDATOR_SOURCE.read_bytes() + Path(__file__).read_bytes()).hexdigest()
+    cache = {} if args.no_cache else load_cache(args.cache)
+    hashes = {str(d): skill_hash(d, salt) for d in skill_dirs}
+    pending = [
+        d for d in skill_dirs if cache.get(str(d), {}).get("hash") != hashes[str(d)] or "record" not in cache[str(d)]
+    ]
+
+    started = time.perf_counter()
+    if len(pending) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as pool:
+            fresh = dict(zip(pending, pool.map(check_skill, pending)))
+    else:
+        fresh = {d: check_skill(d) for d in pending}
+
+    quiet = args.format is not None and args.output is None
+    records = []
+    for skill_dir in skill_dirs:
+        key = str(skill_dir)
+        rel = skill_dir.relative_to(args.skills_dir).as_posix()
+        if skill_dir in fresh:
+            record = fresh[skill_dir]
+            cache[key] = {"hash": hashes[key], "record": record}
+            tag = "ok" if record["status"] == "passed" else "FAIL"
+            line = f"  [{tag}] {rel} ({record['duration_ms']:.1f} ms)"
+        else:
+            record = dict(cache[key]["record"], cached=True, duration_ms=0.0)
+            line = f"  [cached] {rel}"
+        if record["status"] != "passed":
+            line += f": {record['message']}"
+        if not quiet:
+            print(line)
+        records.append(record)
+    failures = sum(1 for r in records if r["status"] != "passed")
+
+    known = set(hashes)
+    cache = {key: value for key, value in cache.items() if key in known}
+    if not args.no_cache:
+        save_cache(args.cache, cache)
+
+    total_ms = (time.perf_counter() - started) * 1000
+    if args.format:
+        report = RENDERERS[args.format](records)
+        if args.output:
+            args.output.write_text(report)
+        else:
+            print(report, end="")
+    if not quiet:
+        print(
+            f"Validated {len(pending)} skill(s), {len(skill_dirs) - len(pending)} cached, "
+            f"{failures} failed in {total_ms:.1f} ms"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,54 +1,289 @@
 #!/usr/bin/env python3
-"""Generate CSS variables and TS token exports from a JSON token file."""
+"""Compile a JSON token file into CSS variables and TS token exports, per theme.
+
+Nested keys are joined with "-" into variable names (`{"space": {"0.5": ...}}` becomes
+`--space-0.5`). Leaves are plain values or `{"$value": ...}` objects. String values may
+reference other tokens by their dotted key path, `{color.primary}`, alone or inside a
+larger value (`1px solid {color.border}`); braces that do not name a token are kept as
+text. References are resolved in topological order and cycles are reported with their
+path. Two keys that produce the same variable name or the same reference path are an
+error.
+
+Themes (brands, modes) are partial token trees under a top-level `"$themes"` key or given
+with `--theme NAME=FILE`. Each theme writes `<stem>.<theme>.css` with a
+`[data-theme="<theme>"]` block holding only the tokens whose value differs from the base,
+and `<stem>.<theme>.ts` with the full resolved set. Only tokens that are overridden, or
+depend on an override, are re-resolved per theme. Output files are rewritten only when
+their content changed, so bundlers watching them do not rebuild needlessly, and theme
+outputs of themes no longer configured are removed.
+"""
 
 from __future__ import annotations
 
 import argparse
+import glob
 import json
+import os
+import re
+from collections import deque
 from pathlib import Path
+from typing import Callable
+
+THEMES_KEY = "$themes"
+VALUE_KEY = "$value"
+REFERENCE = re.compile(r"\{([^{}]+)\}")
+THEME_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
 
+class TokenError(ValueError):
+    pass
 
-def flatten(prefix: str, obj: dict, out: dict[str, str]) -> None:
+
+def collect(obj: dict, out: dict[str, tuple[tuple[str, ...], str]], keys: tuple[str, ...] = ()) -> None:
+    """Leaf values as variable name -> (key path, value). Only the top-level `$themes` key is
+    skipped; a `{"$value": ...}` object is one leaf and its other keys are metadata."""
     for key, value in obj.items():
-        token = f"{prefix}-{key}" if prefix else key
-        if isinstance(value, dict):
-            flatten(token, value, out)
+        if not keys and key == THEMES_KEY:
+            continue
+        path = (*keys, key)
+        if isinstance(value, dict) and VALUE_KEY not in value:
+            collect(value, out, path)
+            continue
+        name = "-".join(path)
+        if name in out and out[name][0] != path:
+            raise TokenError(f"--{name} is produced by both {'.'.join(out[name][0])!r} and {'.'.join(path)!r}")
+        out[name] = (path, str(value[VALUE_KEY] if isinstance(value, dict) else value))
+
+
+def index_tokens(tokens: dict[str, tuple[tuple[str, ...], str]]) -> tuple[dict[str, str], dict[str, str]]:
+    """Raw values by variable name, and variable name by dotted reference path."""
+    raw: dict[str, str] = {}
+    paths: dict[str, str] = {}
+    for name, (path, value) in tokens.items():
+        dotted = ".".join(path)
+        if paths.setdefault(dotted, name) != name:
+            raise TokenError(f"{{{dotted}}} is ambiguous: it names both --{paths[dotted]} and --{name}")
+        raw[name] = value
+    return raw, paths
+
+
+def dependencies(raw: dict[str, str], paths: dict[str, str]) -> dict[str, list[str]]:
+    """Referenced tokens per token; `{...}` that names no token is plain text, not a reference."""
+    return {
+        name: [paths[ref] for ref in REFERENCE.findall(value) if ref in paths] if "{" in value else []
+        for name, value in raw.items()
+    }
+
+
+def find_cycle(deps: dict[str, list[str]], remaining: set[str]) -> list[str]:
+    """A reference cycle among tokens Kahn's algorithm could not order."""
+    start = next(iter(sorted(remaining)))
+    seen: dict[str, int] = {}
+    path: list[str] = []
+    token = start
+    while token not in seen:
+        seen[token] = len(path)
+        path.append(token)
+        # Every unordered token has at least one unordered dependency.
+        token = next(ref for ref in deps[token] if ref in remaining)
+    return path[seen[token] :] + [token]
+
+
+def resolve(
+    raw: dict[str, str],
+    deps: dict[str, list[str]],
+    paths: dict[str, str],
+    base: dict[str, str] | None = None,
+    changed: set[str] | None = None,
+) -> dict[str, str]:
+    """Resolve references in topological order.
+
+    With `base` (already resolved) and `changed`, only the changed tokens and everything that
+    depends on them are recomputed."""
+    dependents: dict[str, list[str]] = {}
+    for token, refs in deps.items():
+        for ref in refs:
+            dependents.setdefault(ref, []).append(token)
+
+    if base is None or changed is None:
+        targets = set(raw)
+        resolved: dict[str, str] = {}
+    else:
+        targets = set(changed)
+        queue = deque(changed)
+        while queue:
+            for dependent in dependents.get(queue.popleft(), ()):
+                if dependent not in targets:
+                    targets.add(dependent)
+                    queue.append(dependent)
+        resolved = {token: value for token, value in base.items() if token not in targets}
+
+    pending = {token: sum(1 for ref in deps[token] if ref in targets) for token in targets}
+    ready = deque(sorted(token for token, count in pending.items() if count == 0))
+    while ready:
+        token = ready.popleft()
+        value = raw[token]
+        match = REFERENCE.fullmatch(value) if deps[token] else None
+        if match and match[1] in paths:
+            resolved[token] = resolved[paths[match[1]]]
+        elif deps[token]:
+            resolved[token] = REFERENCE.sub(lambda m: resolved[paths[m[1]]] if m[1] in paths else m[0], value)
         else:
-            out[token] = str(value)
+            resolved[token] = value
+        for dependent in dependents.get(token, ()):
+            if dependent in pending:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
 
+    if len(resolved) < len(raw):
+        remaining = {token for token in targets if token not in resolved}
+        raise TokenError("Reference cycle: " + " -> ".join(find_cycle(deps, remaining)))
+    return resolved
 
-def write_css(tokens: dict[str, str], output: Path) -> None:
-    lines = [":root {"]
+
+def render_css(tokens: dict[str, str], selector: str = ":root") -> str:
+    lines = [f"{selector} {{"]
     for key, value in sorted(tokens.items()):
         lines.append(f"  --{key}: {value};")
     lines.append("}")
-    output.write_text("\n".join(lines) + "\n")
+    return "\n".join(lines) + "\n"
 
 
-def write_ts(tokens: dict[str, str], output: Path) -> None:
+def render_ts(tokens: dict[str, str]) -> str:
+    quote = json.encoder.encode_basestring  # a JS string literal; non-ASCII text is kept as is
     lines = ["export const tokens = {"]
     for key, value in sorted(tokens.items()):
-        lines.append(f'  "{key}": "{value}",')
+        lines.append(f"  {quote(key)}: {quote(value)},")
     lines.append("} as const;\n")
-    output.write_text("\n".join(lines))
+    return "\n".join(lines)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    try:
+        if path.read_text() == content:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+    return True
+
+
+def theme_path(path: Path, theme: str) -> Path:
+    return path.with_name(f"{path.stem}.{theme}{path.suffix}")
+
+
+def stale_theme_outputs(path: Path, themes: dict, header: Callable[[str], str]) -> list[Path]:
+    """`<stem>.<theme><suffix>` files next to `path` for themes no longer configured.
+
+    Only files that start the way this script writes them (`header(theme)`) are matched,
+    so unrelated files such as `tokens.min.css` are left alone."""
+    stale = []
+    prefix, suffix = f"{path.stem}.", path.suffix
+    for candidate in sorted(path.parent.glob(glob.escape(prefix) + "*" + glob.escape(suffix))):
+        theme = candidate.name[len(prefix) : len(candidate.name) - len(suffix)]
+        if theme in themes or not THEME_NAME.match(theme):
+            continue
+        expected = header(theme)
+        try:
+            with candidate.open() as handle:
+                if handle.read(len(expected)) == expected:
+                    stale.append(candidate)
+        except (OSError, UnicodeDecodeError):
+            continue
+    return stale
+
+
+def load_themes(data: dict, cli_themes: list[str]) -> dict[str, dict]:
+    themes = data.get(THEMES_KEY, {})
+    if not isinstance(themes, dict):
+        raise TokenError(f"{THEMES_KEY} must be an object of theme name -> token overrides")
+    themes = dict(themes)
+    for spec in cli_themes:
+        name, sep, file = spec.partition("=")
+        if not sep:
+            raise TokenError(f"--theme expects NAME=FILE, got {spec!r}")
+        try:
+            themes[name] = json.loads(Path(file).read_text())
+        except OSError as exc:
+            raise TokenError(f"--theme {name}: cannot read {file}: {exc.strerror or exc}") from None
+        except ValueError as exc:
+            raise TokenError(f"--theme {name}: {file} is not valid JSON: {exc}") from None
+    for name, overrides in themes.items():
+        if not THEME_NAME.match(name):
+            raise TokenError(f"Theme name {name!r} must match {THEME_NAME.pattern}")
+        if not isinstance(overrides, dict):
+            raise TokenError(f"Theme {name!r} must be a JSON object")
+    return themes
+
+
+def compile_tokens(data: dict, cli_themes: list[str]) -> tuple[dict[str, str], dict[str, tuple[dict, dict]]]:
+    """Resolved base tokens and, per theme, (full resolved tokens, tokens differing from base)."""
+    collected: dict[str, tuple[tuple[str, ...], str]] = {}
+    collect(data, collected)
+    raw, paths = index_tokens(collected)
+    deps = dependencies(raw, paths)
+    base = resolve(raw, deps, paths)
+
+    compiled = {}
+    for name, overrides in load_themes(data, cli_themes).items():
+        try:
+            merged = dict(collected)
+            collect(overrides, merged)  # raises if an override collides with a base token's name
+            overridden = {token for token, entry in merged.items() if collected.get(token) != entry}
+            merged_raw = {token: value for token, (_, value) in merged.items()}
+            if merged.keys() == collected.keys():
+                merged_paths = paths
+                merged_deps = {**deps, **dependencies({t: merged_raw[t] for t in overridden}, paths)}
+            else:  # new tokens can turn text that named nothing into a reference
+                merged_raw, merged_paths = index_tokens(merged)
+                merged_deps = dependencies(merged_raw, merged_paths)
+            tokens = resolve(merged_raw, merged_deps, merged_paths, base, overridden)
+        except TokenError as exc:
+            raise TokenError(f"theme {name}: {exc}") from None
+        diff = {token: value for token, value in tokens.items() if base.get(token) != value}
+        compiled[name] = (tokens, diff)
+    return base, compiled
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("input", type=Path, help="JSON token file")
     parser.add_argument("--css-out", type=Path, default=Path("tokens.css"))
     parser.add_argument("--ts-out", type=Path, default=Path("tokens.ts"))
+    parser.add_argument("--theme", action="append", default=[], help="Extra theme overrides as NAME=FILE (repeatable)")
     args = parser.parse_args()
 
     data = json.loads(args.input.read_text())
     if not isinstance(data, dict):
         raise SystemExit("Token file must contain a JSON object")
 
-    flattened: dict[str, str] = {}
-    flatten("", data, flattened)
-    write_css(flattened, args.css_out)
-    write_ts(flattened, args.ts_out)
-    print(f"Generated {len(flattened)} tokens -> {args.css_out}, {args.ts_out}")
+    try:
+        base, themes = compile_tokens(data, args.theme)
+    except TokenError as exc:
+        raise SystemExit(str(exc)) from None
+
+    outputs = {args.css_out: render_css(base), args.ts_out: render_ts(base)}
+    for name, (tokens, diff) in themes.items():
+        outputs[theme_path(args.css_out, name)] = render_css(diff, f'[data-theme="{name}"]')
+        outputs[theme_path(args.ts_out, name)] = render_ts(tokens)
+        print(f"  [theme] {name}: {len(diff)} token(s) differ from base")
+
+    written = [path for path, content in outputs.items() if write_if_changed(path, content)]
+    for path in written:
+        print(f"  [write] {path}")
+    stale = stale_theme_outputs(args.css_out, themes, lambda name: f'[data-theme="{name}"] {{\n')
+    stale += stale_theme_outputs(args.ts_out, themes, lambda name: "export const tokens = {\n")
+    for path in stale:
+        path.unlink()
+        print(f"  [remove] {path}")
+    print(
+        f"Generated {len(base)} tokens, {len(themes)} theme(s) -> "
+        f"{len(written)} file(s) written, {len(outputs) - len(written)} unchanged, {len(stale)} removed"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Build many Plotly dashboards from one dataset load.
+
+The spec file (see assets/dashboard-batch-spec.json) lists dashboards with their filters:
+
+    {"defaults": {"large": false},
+     "dashboards": [{"name": "na", "regions": ["NA"], "start": "2026-01-01", "title": "North America"}]}
+
+Per dashboard: `name` (required), `out` (default `<out-dir>/<name>.html`), `title`,
+`start`/`end` (YYYY-MM-DD, inclusive), `regions`, and `large` with `max_points`,
+`downsample`, `max_scatter_points`. The source is read once, restricted to the union of
+all dashboards' filters, then every dashboard is filtered and rendered in a process pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from build_plotly_dashboard import (
+    DOWNSAMPLERS,
+    dashboard_figure,
+    filter_frame,
+    iter_chunks,
+    large_dashboard_figure,
+    write_dashboard,
+)
+
+SPEC_KEYS = {
+    "name",
+    "out",
+    "title",
+    "start",
+    "end",
+    "regions",
+    "large",
+    "max_points",
+    "downsample",
+    "max_scatter_points",
+}
+
+_frame = None
+
+
+def load_spec(path: Path, out_dir: Path) -> list[dict[str, Any]]:
+    spec = json.loads(path.read_text())
+    defaults = spec.get("defaults", {})
+    dashboards = []
+    names = set()
+    for i, item in enumerate(spec.get("dashboards", [])):
+        entry = {**defaults, **item}
+        unknown = entry.keys() - SPEC_KEYS
+        if unknown:
+            raise SystemExit(f"{path}: dashboard #{i}: unknown keys {sorted(unknown)}")
+        if not entry.get("name"):
+            raise SystemExit(f"{path}: dashboard #{i}: missing 'name'")
+        if entry["name"] in names:
+            raise SystemExit(f"{path}: duplicate dashboard name {entry['name']!r}")
+        if entry.get("downsample", "lttb") not in DOWNSAMPLERS:
+            raise SystemExit(f"{path}: {entry['name']}: downsample must be one of {DOWNSAMPLERS}")
+        names.add(entry["name"])
+        for key in ("start", "end"):
+            if entry.get(key):
+                entry[key] = date.fromisoformat(entry[key])
+        entry["out"] = Path(entry["out"]) if entry.get("out") else out_dir / f"{entry['name']}.html"
+        dashboards.append(entry)
+    if not dashboards:
+        raise SystemExit(f"{path}: no dashboards")
+    return dashboards
+
+
+def union_filters(dashboards: list[dict[str, Any]]) -> dict[str, Any]:
+    """Widest filters that still cover every dashboard, pushed down to the single load."""
+    starts = [d.get("start") for d in dashboards]
+    ends = [d.get("end") for d in dashboards]
+    regions = [d.get("regions") for d in dashboards]
+    return {
+        "start": None if None in starts else min(starts),
+        "end": None if None in ends else max(ends),
+        "regions": None if not all(regions) else sorted({r for rs in regions for r in rs}),
+    }
+
+
+def init_worker(frame) -> None:
+    global _frame
+    _frame = frame
+
+
+def render(entry: dict[str, Any], payload: bool, plotly_js: str | None) -> dict[str, Any]:
+    """Filter the shared frame, build and write one dashboard; returns timings and its log."""
+    log = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        df = filter_frame(_frame, entry.get("start"), entry.get("end"), entry.get("regions"))
+        filtered = time.perf_counter()
+        if entry.get("large"):
+            fig = large_dashboard_figure(
+                [df],
+                entry.get("max_points", 2000),
+                entry.get("downsample", "lttb"),
+                entry.get("max_scatter_points", 20_000),
+            )
+        else:
+            fig = dashboard_figure(df)
+        if entry.get("title"):
+            fig.update_layout(title_text=entry["title"])
+        built = time.perf_counter()
+        entry["out"].parent.mkdir(parents=True, exist_ok=True)
+        write_dashboard(fig, entry["out"], payload, plotly_js)
+    written = time.perf_counter()
+    return {
+        "name": entry["name"],
+        "out": str(entry["out"]),
+        "rows": len(df),
+        "filter_ms": round((filtered - started) * 1000, 1),
+        "figure_ms": round((built - filtered) * 1000, 1),
+        "write_ms": round((written - built) * 1000, 1),
+        "total_ms": round((written - started) * 1000, 1),
+        "log": log.getvalue(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="Input CSV, Parquet, Arrow/Feather file or Parquet dataset directory")
+    parser.add_argument("spec", type=Path, help="JSON spec listing dashboards and their filters")
+    parser.add_argument("--out-dir", type=Path, default=Path("dashboards"), help="Default output directory")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--payload", action="store_true", help="Write HTML shells plus .json.gz payloads")
+    parser.add_argument("--plotly-js", help="Payload mode: plotly.js URL/path (default: shared file per directory)")
+    parser.add_argument("--report", type=Path, help="Optional JSON timing report")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    dashboards = load_spec(args.spec, args.out_dir)
+    started = time.perf_counter()
+    frame = pd.concat(iter_chunks(args.source, None, **union_filters(dashboards)), ignore_index=True)
+    load_s = time.perf_counter() - started
+    print(f"Loaded {len(frame)} rows from {args.source} in {load_s:.2f}s; rendering {len(dashboards)} dashboard(s)")
+
+    results = []
+    jobs = max(1, min(args.jobs, len(dashboards)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(frame,)) as pool:
+        futures = [pool.submit(render, entry, args.payload, args.plotly_js) for entry in dashboards]
+        for future in as_completed(futures):
+            result = future.result()
+            log = result.pop("log")
+            results.append(result)
+            print(
+                f"  [{result['name']}] {result['rows']} rows  filter {result['filter_ms']:.1f} ms  "
+                f"figure {result['figure_ms']:.1f} ms  write {result['write_ms']:.1f} ms -> {result['out']}"
+            )
+            for line in log.splitlines():
+                print(f"  {line}")
+    wall_s = time.perf_counter() - started
+    render_s = sum(r["total_ms"] for r in results) / 1000
+    print(f"Built {len(results)} dashboard(s) in {wall_s:.2f}s ({render_s:.2f}s of rendering across {jobs} worker(s))")
+
+    if args.report:
+        order = {entry["name"]: i for i, entry in enumerate(dashboards)}
+        report = {
+            "source": str(args.source),
+            "rows": len(frame),
+            "load_s": round(load_s, 3),
+            "wall_s": round(wall_s, 3),
+            "jobs": jobs,
+            "dashboards": sorted(results, key=lambda r: order[r["name"]]),
+        }
+        args.report.write_text(json.dumps(report, indent=2))
+        print(f"Timing report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
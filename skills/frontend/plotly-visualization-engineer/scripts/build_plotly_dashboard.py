@@ -1,19 +1,265 @@
 #!/usr/bin/env python3
-"""Build an interactive Plotly dashboard from CSV metrics."""
+"""Build an interactive Plotly dashboard from CSV, Parquet or Arrow/Feather metrics.
+
+Only the six columns the charts use are read. Parquet and Arrow/Feather inputs (a file or
+a Parquet dataset directory) go through `pyarrow.dataset`, so column pruning and the
+`--start`/`--end`/`--region` filters are pushed down to the scan; CSV input is filtered
+chunk by chunk after parsing.
+
+`--large` handles millions of rows: the input is streamed in typed chunks, each region's
+revenue trend is downsampled (LTTB or min-max) to `--max-points`, the bar chart is
+pre-aggregated, and the scatter is a uniform sample drawn as WebGL (`Scattergl`).
+
+`--incremental` keeps day x region x channel aggregates per source file in `--cache` and
+only re-reads files whose size or mtime changed; a CSV that only grew is parsed from the
+previous end of file, recognised by the ends of its old content, so only the appended
+bytes are read. The file is the unit of reuse: a file edited in place (not just
+appended to) is re-read in full and reported with a warning, so incremental mode pays
+off for append-only CSVs or dataset directories with one file per day or batch. The
+charts are assembled from the aggregates: daily revenue per region, orders per
+region/channel, and one scatter point per partition.
+
+`--payload` writes the figure as `<out>.json.gz` (plotly >= 6 encodes numeric arrays as
+base64 typed arrays) next to a small HTML shell that loads a shared, versioned plotly.js
+file (or `--plotly-js` URL) and inflates the payload in the browser. Serve it over HTTP.
+
+`--serve` runs a local HTTP server instead of writing a file. Browsers load the current
+figure once, then receive only newly appended rows over Server-Sent Events, applied with
+`Plotly.extendTraces` (bars, being totals, are restyled). The source is polled every
+`--interval` seconds: a CSV is tailed from its last byte offset, a Parquet dataset
+directory is checked for new files. `--window` caps the points kept per trace.
+"""
 
 from __future__ import annotations
 
 import argparse
+import copy
+import gzip
+import hashlib
+import html
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlparse
+
+COLUMNS = ["date", "region", "channel", "revenue", "orders", "ad_spend"]
+DTYPES = {
+    "region": "category",
+    "channel": "category",
+    "revenue": "float64",
+    "orders": "float64",
+    "ad_spend": "float64",
+}
+# "NA" is a region code (North America), not a missing value: only blank cells count as missing.
+NA_VALUES = {column: ["", "NaN", "nan"] for column in COLUMNS}
+CSV_OPTIONS = {
+    "usecols": COLUMNS,
+    "dtype": DTYPES,
+    "parse_dates": ["date"],
+    "keep_default_na": False,
+    "na_values": NA_VALUES,
+}
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+DOWNSAMPLERS = ("lttb", "minmax")
+# px.scatter's default largest marker diameter, used to scale bubble sizes the same way.
+MAX_MARKER_SIZE = 20
+DEFAULT_CACHE = Path(".cache") / "plotly_dashboard.json"
+# Bump when the partition aggregates change shape so stale caches are discarded.
+AGGREGATE_VERSION = 2
+# Bytes hashed at each end of a CSV to recognise its previous content after an append.
+FINGERPRINT_BLOCK = 64 * 1024
+PAYLOAD_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+</head>
+<body>
+<div id="dashboard"></div>
+<script>
+(async () => {{
+  const bytes = new Uint8Array(await (await fetch("{payload}")).arrayBuffer());
+  let body = new Blob([bytes]).stream();
+  // A server sending Content-Encoding: gzip has already inflated it; otherwise check the gzip magic.
+  if (bytes[0] === 0x1f && bytes[1] === 0x8b) body = body.pipeThrough(new DecompressionStream("gzip"));
+  const figure = await new Response(body).json();
+  Plotly.newPlot("dashboard", figure.data, figure.layout, {{responsive: true}});
+}})();
+</script>
+</body>
+</html>
+"""
+LIVE_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+</head>
+<body>
+<div id="dashboard"></div>
+<script>
+(async () => {{
+  const plot = document.getElementById("dashboard");
+  const state = await (await fetch("figure.json")).json();
+  await Plotly.newPlot(plot, state.figure.data, state.figure.layout, {{responsive: true}});
+  // EventSource resends the last event id on reconnect, so nothing is missed or applied twice.
+  const events = new EventSource(`events?since=${{state.seq}}`);
+  events.onmessage = (message) => {{
+    const event = JSON.parse(message.data);
+    if (event.op === "reload") location.reload();
+    else if (event.op === "add") Plotly.addTraces(plot, event.traces);
+    else if (event.op === "extend") Plotly.extendTraces(plot, event.update, event.indices, event.window);
+    else if (event.op === "restyle") Plotly.restyle(plot, event.update, event.indices);
+  }};
+}})();
+</script>
+</body>
+</html>
+"""
+LIVE_EVENT_BACKLOG = 1000
+
+
+def source_format(source: Path) -> str:
+    if source.is_dir() or source.suffix.lower() in PARQUET_SUFFIXES:
+        return "parquet"
+    if source.suffix.lower() in ARROW_SUFFIXES:
+        return "ipc"
+    return "csv"
+
+
+def arrow_filter(date_type, start: date | None, end: date | None, regions: list[str] | None):
+    """Dataset filter expression for an inclusive day range and a region list, or None."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    def bound(day: date):
+        # Compare in the column's own type so the predicate can prune row groups by statistics.
+        if pa.types.is_timestamp(date_type):
+            stamp = pd.Timestamp(day)
+            return pa.scalar(stamp.tz_localize(date_type.tz) if date_type.tz else stamp, type=date_type)
+        if pa.types.is_date(date_type):
+            return pa.scalar(day, type=date_type)
+        return pa.scalar(day.isoformat())
+
+    clauses = []
+    if start is not None:
+        clauses.append(ds.field("date") >= bound(start))
+    if end is not None:
+        clauses.append(ds.field("date") < bound(end + timedelta(days=1)))
+    if regions:
+        clauses.append(ds.field("region").isin(regions))
+    expr = None
+    for clause in clauses:
+        expr = clause if expr is None else expr & clause
+    return expr
+
+
+def open_dataset(source: Path, files: list[Path] | None = None):
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise SystemExit(f"Reading {source} requires pyarrow (pip install pyarrow)") from None
+    fmt = source_format(source)
+    if not source.is_dir():
+        return ds.dataset(source, format=fmt)
+    if files is None:
+        return ds.dataset(source, format=fmt, partitioning="hive")
+    # Hive keys such as date=... live in directory names, so resolve them against the dataset root.
+    return ds.dataset([str(f) for f in files], format=fmt, partitioning="hive", partition_base_dir=str(source))
+
+
+def typed_frame(df):
+    """Cast a chunk to the dashboard dtypes, whatever format it was read from."""
+    import pandas as pd
+
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"])
+    return df.astype(DTYPES)
+
 
+def iter_chunks(
+    source: Path,
+    chunksize: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+    files: list[Path] | None = None,
+) -> Iterator:
+    """Yield typed DataFrame chunks of the six dashboard columns, filtered by day range and region.
 
-def build_dashboard(csv_path: Path, output_html: Path) -> None:
+    `files` restricts a dataset directory to some of its files."""
     import pandas as pd
+
+    if source_format(source) != "csv":
+        dataset = open_dataset(source, files)
+        expr = arrow_filter(dataset.schema.field("date").type, start, end, regions)
+        scanner = dataset.scanner(columns=COLUMNS, filter=expr, batch_size=chunksize or 1 << 20)
+        if chunksize is None:
+            yield typed_frame(scanner.to_table().to_pandas())
+            return
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield typed_frame(batch.to_pandas())
+        return
+
+    reader = pd.read_csv(source, chunksize=chunksize, **CSV_OPTIONS)
+    for chunk in [reader] if chunksize is None else reader:
+        yield filter_frame(chunk, start, end, regions)
+
+
+def filter_frame(df, start: date | None = None, end: date | None = None, regions: list[str] | None = None):
+    """Rows of an already loaded frame within the inclusive day range and region list."""
+    import pandas as pd
+
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df["date"] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df["date"] < pd.Timestamp(end + timedelta(days=1))
+    if regions:
+        mask &= df["region"].isin(regions)
+    return df if mask.all() else df[mask]
+
+
+def load_dashboard_figure(
+    source: Path,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+):
+    """Read `source` (any supported format) with the filters pushed down and build the figure."""
+    import pandas as pd
+
+    return dashboard_figure(pd.concat(iter_chunks(source, None, start, end, regions), ignore_index=True))
+
+
+def build_dashboard(
+    csv_path: Path,
+    output_html: Path,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+) -> None:
+    load_dashboard_figure(csv_path, start, end, regions).write_html(output_html)
+
+
+def dashboard_figure(df):
     import plotly.express as px
     from plotly.subplots import make_subplots
-    import plotly.graph_objects as go
 
-    df = pd.read_csv(csv_path, parse_dates=["date"])
+    # Plain strings keep px's first-seen legend order instead of the category order.
+    df = df.astype({"region": str, "channel": str})
 
     trend = px.line(df, x="date", y="revenue", color="region", title="Revenue Trend")
     mix = px.bar(df, x="region", y="orders", color="channel", barmode="group", title="Orders by Region/Channel")
@@ -37,16 +283,787 @@ def build_dashboard(csv_path: Path, output_html: Path) -> None:
         fig.add_trace(trace, row=3, col=1)
 
     fig.update_layout(height=1200, title_text="Business Dashboard", template="plotly_white")
-    fig.write_html(output_html)
+    return fig
+
+
+def lttb(x, y, n_out: int):
+    """Indices of the Largest-Triangle-Three-Buckets downsample of a sorted series."""
+    import numpy as np
+
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    # Each bucket is scored against the average point of the bucket after it.
+    next_x = np.append(((sum_x[ends] - sum_x[starts]) / (ends - starts))[1:], x[-1])
+    next_y = np.append(((sum_y[ends] - sum_y[starts]) / (ends - starts))[1:], y[-1])
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[a] - next_x[i]) * (by - y[a]) - (x[a] - bx) * (next_y[i] - y[a]))
+        a = start + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def minmax(x, y, n_out: int):
+    """Indices of the minimum and maximum of each of n_out / 2 equal-count buckets."""
+    import numpy as np
+
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    picked = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = y[start:end]
+            picked += [start + int(np.argmin(bucket)), start + int(np.argmax(bucket))]
+    return np.unique(np.array(picked, dtype=np.int64))
+
+
+def scan_large(chunks, max_scatter_points: int, seed: int = 0) -> dict:
+    """Stream the chunks once; keep trend series, bar totals and a bottom-k uniform scatter sample."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    series: dict[str, list] = {}
+    totals: dict[tuple[str, str], float] = {}
+    sample = None
+    rows = 0
+
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=["date", "revenue", "region"])
+        rows += len(chunk)
+        for region, part in chunk.groupby("region", observed=True):
+            series.setdefault(str(region), []).append(
+                (part["date"].to_numpy("datetime64[ns]"), part["revenue"].to_numpy())
+            )
+        for (region, channel), orders in chunk.groupby(["region", "channel"], observed=True)["orders"].sum().items():
+            totals[(str(region), str(channel))] = totals.get((str(region), str(channel)), 0.0) + float(orders)
+
+        # Bottom-k sampling: the rows with the k smallest random keys are a uniform sample.
+        keys = rng.random(len(chunk))
+        if len(chunk) > max_scatter_points:
+            rows_kept = np.argpartition(keys, max_scatter_points)[:max_scatter_points]
+            chunk, keys = chunk.iloc[rows_kept], keys[rows_kept]
+        part = chunk[["orders", "revenue", "ad_spend", "region", "channel"]].astype({"region": str, "channel": str})
+        part = part.assign(_key=keys)
+        sample = part if sample is None else pd.concat([sample, part], ignore_index=True)
+        if len(sample) > max_scatter_points:
+            keep = np.argpartition(sample["_key"].to_numpy(), max_scatter_points)[:max_scatter_points]
+            sample = sample.iloc[keep].reset_index(drop=True)
+
+    trend = {}
+    for region, parts in series.items():
+        dates = np.concatenate([d for d, _ in parts])
+        revenue = np.concatenate([r for _, r in parts])
+        order = np.argsort(dates, kind="stable")
+        trend[region] = (dates[order], revenue[order])
+    return {"rows": rows, "trend": trend, "totals": totals, "sample": sample}
+
+
+def region_colors(regions) -> dict[str, str]:
+    import plotly.express as px
+
+    palette = px.colors.qualitative.Plotly
+    return {region: palette[i % len(palette)] for i, region in enumerate(sorted(regions))}
+
+
+def add_mix_traces(fig, totals: dict[tuple[str, str], float]) -> None:
+    """Grouped orders bars (one trace per channel) from (region, channel) totals on row 2."""
+    import numpy as np
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    channels = sorted({channel for _, channel in totals})
+    palette = px.colors.qualitative.D3
+    for i, channel in enumerate(channels):
+        bars = sorted((region, total) for (region, ch), total in totals.items() if ch == channel)
+        fig.add_trace(
+            go.Bar(
+                x=[region for region, _ in bars],
+                y=np.array([total for _, total in bars]),
+                name=channel,
+                marker_color=palette[i % len(palette)],
+            ),
+            row=2,
+            col=1,
+        )
+
+
+def add_scatter_traces(fig, points, colors: dict[str, str]) -> None:
+    """WebGL orders-vs-revenue bubbles (one trace per region) sized by ad spend on row 3."""
+    import plotly.graph_objects as go
+
+    sizeref = 2.0 * max(float(points["ad_spend"].max()), 1e-9) / MAX_MARKER_SIZE**2
+    for region, part in points.groupby("region"):
+        fig.add_trace(
+            go.Scattergl(
+                x=part["orders"].to_numpy(),
+                y=part["revenue"].to_numpy(),
+                mode="markers",
+                name=region,
+                legendgroup=region,
+                showlegend=False,
+                marker={
+                    "color": colors[region],
+                    "size": part["ad_spend"].fillna(0).to_numpy(),
+                    "sizemode": "area",
+                    "sizeref": sizeref,
+                    "sizemin": 1,
+                },
+                customdata=part["channel"].to_numpy(),
+                hovertemplate="orders=%{x}<br>revenue=%{y}<br>channel=%{customdata}<extra>" + region + "</extra>",
+            ),
+            row=3,
+            col=1,
+        )
+
+
+def build_large_dashboard(
+    source: Path,
+    max_points: int = 2000,
+    downsample: str = "lttb",
+    max_scatter_points: int = 20_000,
+    chunksize: int = 500_000,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+):
+    chunks = iter_chunks(source, chunksize, start, end, regions)
+    return large_dashboard_figure(chunks, max_points, downsample, max_scatter_points)
+
+
+def large_dashboard_figure(chunks, max_points: int = 2000, downsample: str = "lttb", max_scatter_points: int = 20_000):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    data = scan_large(chunks, max_scatter_points)
+    pick = lttb if downsample == "lttb" else minmax
+    sample = data["sample"]
+    colors = region_colors(set(data["trend"]) | set(sample["region"] if sample is not None else ()))
+
+    fig = make_subplots(rows=3, cols=1, subplot_titles=["Trend", "Mix", "Correlation"])
+
+    for region, (dates, revenue) in sorted(data["trend"].items()):
+        idx = pick(dates.astype("int64"), revenue, max_points)
+        fig.add_trace(
+            go.Scatter(
+                x=dates[idx],
+                y=revenue[idx],
+                mode="lines",
+                name=region,
+                legendgroup=region,
+                line={"color": colors[region]},
+            ),
+            row=1,
+            col=1,
+        )
+        print(f"  [trend] {region}: {len(dates)} -> {len(idx)} points ({downsample})")
+
+    add_mix_traces(fig, data["totals"])
+    print(f"  [mix] {len(data['totals'])} bars from {data['rows']} rows")
+
+    if sample is not None and len(sample):
+        add_scatter_traces(fig, sample, colors)
+        print(f"  [scatter] {data['rows']} -> {len(sample)} points (Scattergl)")
+
+    fig.update_layout(height=1200, title_text="Business Dashboard", template="plotly_white", barmode="group")
+    return fig
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != AGGREGATE_VERSION:
+        return {}
+    return data.get("sources", {})
+
+
+def save_cache(path: Path, sources: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": AGGREGATE_VERSION, "sources": sources}, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def aggregate_chunks(chunks) -> tuple[dict[tuple[str, str, str], list[float]], int]:
+    """Sum revenue, orders, ad spend and rows per (day, region, channel); also return rows read."""
+    partitions: dict[tuple[str, str, str], list[float]] = {}
+    rows = 0
+    for chunk in chunks:
+        rows += len(chunk)
+        chunk = chunk.dropna(subset=["date", "region", "channel"])
+        grouped = chunk.groupby([chunk["date"].dt.normalize(), "region", "channel"], observed=True).agg(
+            revenue=("revenue", "sum"), orders=("orders", "sum"), ad_spend=("ad_spend", "sum"), rows=("date", "size")
+        )
+        for (day, region, channel), values in zip(grouped.index, grouped.to_numpy(dtype=float).tolist()):
+            key = (day.strftime("%Y-%m-%d"), str(region), str(channel))
+            total = partitions.setdefault(key, [0.0, 0.0, 0.0, 0])
+            for i, value in enumerate(values):
+                total[i] += value
+    return partitions, rows
+
+
+def edge_fingerprint(path: Path, size: int) -> str:
+    """Digest of the first and last FINGERPRINT_BLOCK bytes of a file's first `size` bytes.
+
+    Recognises the previous content of a grown CSV without re-reading all of it, so an
+    incremental rebuild reads only the appended bytes however long the history is. An
+    append leaves both ends of the old content intact; a rewrite changes the header or the
+    old last rows. An edit confined to the middle of a file that also grew is not seen."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(size).encode())
+    with path.open("rb") as handle:
+        digest.update(handle.read(min(size, FINGERPRINT_BLOCK)))
+        if size > FINGERPRINT_BLOCK:
+            handle.seek(max(FINGERPRINT_BLOCK, size - FINGERPRINT_BLOCK))
+            digest.update(handle.read(size - handle.tell()))
+    return digest.hexdigest()
+
+
+def csv_tail_chunks(path: Path, offset: int, chunksize: int):
+    """Typed chunks of the rows appended to a CSV after byte `offset`."""
+    import pandas as pd
+
+    with path.open("rb") as handle:
+        header = handle.readline()
+        handle.seek(offset)
+        tail = handle.read()
+    return pd.read_csv(io.BytesIO(header + tail), chunksize=chunksize, **CSV_OPTIONS)
+
+
+def ends_with_newline(path: Path, size: int) -> bool:
+    if size == 0:
+        return False
+    with path.open("rb") as handle:
+        handle.seek(size - 1)
+        return handle.read(1) == b"\n"
+
+
+def update_partitions(source: Path, cache_path: Path, chunksize: int) -> tuple[dict, dict]:
+    """Refresh the cached per-file partition aggregates of `source` and merge them.
+
+    Unchanged files (same size and mtime) are reused. A CSV that grew and still starts and
+    ends its old length the same way (edge_fingerprint) is only parsed from the old end of
+    file; anything else is re-read in
+    full, and files that were cached before are listed in stats["rewritten"]."""
+    sources = load_cache(cache_path)
+    previous = sources.get(str(source.resolve()), {})
+    fmt = source_format(source)
+    units = sorted(Path(f) for f in open_dataset(source).files) if source.is_dir() else [source]
+
+    entries: dict[str, dict] = {}
+    changed: set[tuple[str, str, str]] = set()
+    stats = {"units": len(units), "reused": 0, "appended": 0, "reread": 0, "rows": 0, "rewritten": []}
+    for unit in units:
+        key = str(unit.resolve())
+        stat = unit.stat()
+        old = previous.get(key)
+        if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            entries[key] = old
+            stats["reused"] += 1
+            continue
+
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        old_parts = {tuple(row[:3]): row[3:] for row in old["partitions"]} if old else {}
+        appended = False
+        if fmt == "csv":
+            grew = bool(old and old.get("appendable") and stat.st_size > old["size"])
+            appended = grew and edge_fingerprint(unit, old["size"]) == old["fingerprint"]
+            entry["fingerprint"] = edge_fingerprint(unit, stat.st_size)
+            entry["appendable"] = ends_with_newline(unit, stat.st_size)
+
+        if appended:
+            tail, rows = aggregate_chunks(csv_tail_chunks(unit, old["size"], chunksize))
+            parts = {k: list(v) for k, v in old_parts.items()}
+            for k, values in tail.items():
+                total = parts.setdefault(k, [0.0, 0.0, 0.0, 0])
+                for i, value in enumerate(values):
+                    total[i] += value
+            changed |= set(tail)
+            stats["appended"] += 1
+        else:
+            chunks = iter_chunks(source, chunksize, files=[unit]) if source.is_dir() else iter_chunks(unit, chunksize)
+            parts, rows = aggregate_chunks(chunks)
+            changed |= {k for k in parts.keys() | old_parts.keys() if parts.get(k) != old_parts.get(k)}
+            stats["reread"] += 1
+            if old:
+                stats["rewritten"].append(str(unit))
+        stats["rows"] += rows
+        entry["partitions"] = [[*k, *v] for k, v in sorted(parts.items())]
+        entries[key] = entry
+
+    for key in previous.keys() - entries.keys():  # files removed from a dataset directory
+        changed |= {tuple(row[:3]) for row in previous[key]["partitions"]}
+    sources[str(source.resolve())] = entries
+    save_cache(cache_path, sources)
+
+    partitions: dict[tuple[str, str, str], list[float]] = {}
+    for entry in entries.values():
+        for row in entry["partitions"]:
+            total = partitions.setdefault(tuple(row[:3]), [0.0, 0.0, 0.0, 0])
+            for i, value in enumerate(row[3:]):
+                total[i] += value
+    stats["partitions"] = len(partitions)
+    stats["changed"] = len(changed)
+    return partitions, stats
+
+
+def build_incremental_dashboard(
+    source: Path,
+    cache_path: Path = DEFAULT_CACHE,
+    chunksize: int = 500_000,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+):
+    import pandas as pd
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    partitions, stats = update_partitions(source, cache_path, chunksize)
+    print(
+        f"  [incremental] {stats['units']} source file(s): {stats['reused']} reused, {stats['appended']} appended, "
+        f"{stats['reread']} re-read ({stats['rows']} rows parsed)"
+    )
+    print(f"  [partitions] {stats['changed']} of {stats['partitions']} day x region x channel partitions changed")
+    for path in stats["rewritten"]:
+        print(
+            f"  [warn] {path} changed other than by appending and was re-read in full; "
+            "incremental mode needs append-only CSVs or one file per day/batch"
+        )
+
+    # Filters apply to the aggregates, so changing them never invalidates the cache.
+    agg = pd.DataFrame(
+        [[*k, *v] for k, v in partitions.items()],
+        columns=["day", "region", "channel", "revenue", "orders", "ad_spend", "rows"],
+    )
+    if start is not None:
+        agg = agg[agg["day"] >= start.isoformat()]
+    if end is not None:
+        agg = agg[agg["day"] <= end.isoformat()]
+    if regions:
+        agg = agg[agg["region"].isin(regions)]
+    agg["day"] = pd.to_datetime(agg["day"])
+
+    colors = region_colors(agg["region"].unique())
+    fig = make_subplots(rows=3, cols=1, subplot_titles=["Trend", "Mix", "Correlation"])
+    trend = agg.groupby(["region", "day"])["revenue"].sum()
+    for region in sorted(colors):
+        daily = trend.loc[region]
+        fig.add_trace(
+            go.Scatter(
+                x=daily.index,
+                y=daily.to_numpy(),
+                mode="lines",
+                name=region,
+                legendgroup=region,
+                line={"color": colors[region]},
+            ),
+            row=1,
+            col=1,
+        )
+    add_mix_traces(fig, agg.groupby(["region", "channel"])["orders"].sum().to_dict())
+    if len(agg):
+        add_scatter_traces(fig, agg, colors)
+
+    fig.update_layout(height=1200, title_text="Business Dashboard", template="plotly_white", barmode="group")
+    return fig
+
+
+def write_dashboard(fig, output_html: Path, payload: bool = False, plotly_js: str | None = None) -> None:
+    """Write a self-contained HTML file, or an HTML shell plus a gzipped JSON figure payload.
+
+    Without `plotly_js`, the shell references `plotly-<version>.min.js` next to it, written
+    once and shared by every dashboard in the directory."""
+    if not payload:
+        fig.write_html(output_html)
+        return
+    import plotly.offline
+
+    if plotly_js is None:
+        plotly_js = f"plotly-{plotly.offline.get_plotlyjs_version()}.min.js"
+        asset = output_html.parent / plotly_js
+        if not asset.exists():
+            # Atomic, so dashboards written in parallel never see a half-written bundle.
+            tmp = asset.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+            os.replace(tmp, asset)
+    payload_path = output_html.with_suffix(".json.gz")
+    data = fig.to_json().encode()
+    payload_path.write_bytes(gzip.compress(data, mtime=0))  # mtime=0: same figure, same bytes
+    title = fig.layout.title.text or "Dashboard"
+    shell = PAYLOAD_SHELL.format(title=html.escape(title), plotly_js=html.escape(plotly_js), payload=payload_path.name)
+    output_html.write_text(shell, encoding="utf-8")
+    typed_arrays = data.count(b'"bdata"')
+    print(
+        f"  [payload] {payload_path.name}: {payload_path.stat().st_size / 1024:.1f} KB gzipped from "
+        f"{len(data) / 1024:.1f} KB JSON ({typed_arrays} typed arrays)"
+    )
+    print(f"  [shell] {output_html.name}: {len(shell) / 1024:.1f} KB, plotly.js from {plotly_js}")
+
+
+class LiveDashboard:
+    """Figure state for --serve: built from the initial rows, then extended by appended ones.
+
+    Every change is also recorded as a client-side Plotly operation with a sequence number,
+    so connected browsers replay only the operations they have not seen."""
+
+    def __init__(self, layout: dict[str, Any], window: int = 0) -> None:
+        self.window = window
+        self.seq = 0
+        self.events: deque[tuple[int, str]] = deque(maxlen=LIVE_EVENT_BACKLOG)
+        self.changed = threading.Condition()
+        self.reset(layout)
+
+    def snapshot(self) -> str:
+        with self.changed:
+            return json.dumps({"seq": self.seq, "figure": self.figure}, separators=(",", ":"))
+
+    def wait(self, since: int, timeout: float) -> list[tuple[int, str]] | None:
+        """Events after `since`, blocking up to `timeout`; None if the client fell too far behind."""
+        with self.changed:
+            self.changed.wait_for(lambda: self.seq > since, timeout)
+            if self.events and self.events[0][0] > since + 1:
+                return None
+            return [(seq, data) for seq, data in self.events if seq > since]
+
+    def publish(self, ops: list[dict[str, Any]]) -> None:
+        with self.changed:
+            for op in ops:
+                self.seq += 1
+                self.events.append((self.seq, json.dumps(op, separators=(",", ":"))))
+            self.changed.notify_all()
+
+    def reset(self, layout: dict[str, Any]) -> None:
+        """Drop all traces; the sequence keeps counting so connected clients are not confused."""
+        with self.changed:
+            self.figure: dict[str, Any] = {"data": [], "layout": layout}
+            self.traces: dict[tuple[str, str], int] = {}
+            self.colors: dict[str, str] = {}
+            self.totals: dict[tuple[str, str], float] = {}
+            self.sizeref: float | None = None
+
+    def _add(self, key: tuple[str, str], trace: dict[str, Any], ops: list[dict[str, Any]]) -> int:
+        self.traces[key] = len(self.figure["data"])
+        self.figure["data"].append(trace)
+        ops.append({"op": "add", "traces": [copy.deepcopy(trace)]})  # the stored trace gets extended below
+        return self.traces[key]
+
+    def _extend(self, update: dict[str, list], indices: list[int], ops: list[dict[str, Any]]) -> None:
+        for i, index in enumerate(indices):
+            trace = self.figure["data"][index]
+            for path, values in update.items():
+                target = trace
+                *parents, leaf = path.split(".")
+                for parent in parents:
+                    target = target[parent]
+                target[leaf].extend(values[i])
+                if self.window and len(target[leaf]) > self.window:
+                    del target[leaf][: -self.window]
+        ops.append({"op": "extend", "update": update, "indices": indices, "window": self.window or None})
+
+    def _starts_before_end(self, index: int, first: str) -> bool:
+        x = self.figure["data"][index]["x"]
+        return bool(x) and first < x[-1]  # "%Y-%m-%d %H:%M:%S" strings sort chronologically
+
+    def _merge(self, update: dict[str, list], indices: list[int], ops: list[dict[str, Any]]) -> None:
+        """Merge new (x, y) points into line traces in x order and restyle those traces whole."""
+        full: dict[str, list] = {"x": [], "y": []}
+        for i, index in enumerate(indices):
+            trace = self.figure["data"][index]
+            points = sorted(zip(trace["x"] + update["x"][i], trace["y"] + update["y"][i]), key=lambda p: p[0])
+            if self.window:
+                points = points[-self.window :]
+            trace["x"], trace["y"] = [x for x, _ in points], [y for _, y in points]
+            full["x"].append(list(trace["x"]))
+            full["y"].append(list(trace["y"]))
+        ops.append({"op": "restyle", "update": full, "indices": indices})
+
+    def apply(self, df) -> list[dict[str, Any]]:
+        """Fold new rows into the figure; returns the Plotly operations that replay the change."""
+        import plotly.express as px
+
+        df = df.dropna(subset=["date", "region", "revenue"]).sort_values("date", kind="stable")
+        ops: list[dict[str, Any]] = []
+        if not len(df):
+            return ops
+        df = df.astype({"region": str, "channel": str})
+        if self.sizeref is None:
+            self.sizeref = 2.0 * max(float(df["ad_spend"].max()), 1e-9) / MAX_MARKER_SIZE**2
+        palette = px.colors.qualitative.Plotly
+        bar_palette = px.colors.qualitative.D3
+        with self.changed:
+            for region in sorted(set(df["region"]) - self.colors.keys()):
+                color = self.colors[region] = palette[len(self.colors) % len(palette)]
+                line = {"color": color}
+                trend = {"type": "scatter", "mode": "lines", "name": region, "legendgroup": region, "line": line}
+                self._add(("trend", region), {**trend, "x": [], "y": [], "xaxis": "x", "yaxis": "y"}, ops)
+                marker = {"color": color, "size": [], "sizemode": "area", "sizeref": self.sizeref, "sizemin": 1}
+                hover = "orders=%{x}<br>revenue=%{y}<br>channel=%{customdata}<extra>" + region + "</extra>"
+                scatter = {"type": "scattergl", "mode": "markers", "name": region, "legendgroup": region}
+                scatter.update(showlegend=False, marker=marker, customdata=[], hovertemplate=hover)
+                self._add(("scatter", region), {**scatter, "x": [], "y": [], "xaxis": "x3", "yaxis": "y3"}, ops)
+            channels = {key[1] for key in self.traces if key[0] == "mix"}
+            for channel in sorted(set(df["channel"]) - channels):
+                color = bar_palette[len(channels) % len(bar_palette)]
+                channels.add(channel)
+                bar = {"type": "bar", "name": channel, "marker": {"color": color}, "x": [], "y": []}
+                self._add(("mix", channel), {**bar, "xaxis": "x2", "yaxis": "y2"}, ops)
+
+            groups = [(region, part) for region, part in df.groupby("region", sort=True)]
+            dates = [part["date"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist() for _, part in groups]
+            revenue = [part["revenue"].tolist() for _, part in groups]
+            trend_indices = [self.traces[("trend", region)] for region, _ in groups]
+            # A line can only be extended at its end: a region that received rows older than its
+            # last point is merged in date order and sent whole as a restyle instead.
+            late = [i for i, index in enumerate(trend_indices) if self._starts_before_end(index, dates[i][0])]
+            on_time = [i for i in range(len(groups)) if i not in late]
+            if on_time:
+                update = {"x": [dates[i] for i in on_time], "y": [revenue[i] for i in on_time]}
+                self._extend(update, [trend_indices[i] for i in on_time], ops)
+            if late:
+                update = {"x": [dates[i] for i in late], "y": [revenue[i] for i in late]}
+                self._merge(update, [trend_indices[i] for i in late], ops)
+            scatter_update = {
+                "x": [part["orders"].tolist() for _, part in groups],
+                "y": revenue,
+                "marker.size": [part["ad_spend"].fillna(0).tolist() for _, part in groups],
+                "customdata": [part["channel"].tolist() for _, part in groups],
+            }
+            self._extend(scatter_update, [self.traces[("scatter", region)] for region, _ in groups], ops)
+
+            for (region, channel), orders in df.groupby(["region", "channel"])["orders"].sum().items():
+                self.totals[(region, channel)] = self.totals.get((region, channel), 0.0) + float(orders)
+            touched = sorted(set(df["channel"]))
+            bars = [sorted((r, t) for (r, ch), t in self.totals.items() if ch == channel) for channel in touched]
+            update = {"x": [[r for r, _ in b] for b in bars], "y": [[t for _, t in b] for b in bars]}
+            indices = [self.traces[("mix", channel)] for channel in touched]
+            for i, index in enumerate(indices):
+                self.figure["data"][index].update(x=update["x"][i], y=update["y"][i])
+            ops.append({"op": "restyle", "update": update, "indices": indices})
+        return ops
+
+
+class SourceTail:
+    """Yields rows appended to a CSV (from the last complete line) or new files of a Parquet dataset."""
+
+    def __init__(self, source: Path) -> None:
+        if source_format(source) == "csv":
+            self.kind = "csv"
+        elif source.is_dir():
+            self.kind = "dataset"
+        else:
+            raise SystemExit("--serve tails a CSV file or watches a Parquet dataset directory for new files")
+        self.source = source
+        self.offset = 0
+        self.files: set[str] = set()
+
+    def initial(self):
+        import pandas as pd
+
+        if self.kind == "dataset":
+            self.files = set(open_dataset(self.source).files)
+            return pd.concat(iter_chunks(self.source), ignore_index=True)
+        df, _ = self.poll()
+        return df
+
+    def poll(self):
+        """New rows since the last call, and whether the source was truncated (start over)."""
+        import pandas as pd
+
+        if self.kind == "dataset":
+            new = sorted(set(open_dataset(self.source).files) - self.files)
+            if not new:
+                return None, False
+            self.files.update(new)
+            return pd.concat(iter_chunks(self.source, files=[Path(f) for f in new]), ignore_index=True), False
+
+        size = self.source.stat().st_size
+        if size < self.offset:
+            self.offset = 0
+            return None, True
+        if size == self.offset:
+            return None, False
+        with self.source.open("rb") as handle:
+            header = handle.readline()
+            handle.seek(max(self.offset, len(header)))
+            tail = handle.read(size - max(self.offset, len(header)))
+        # A writer may be mid-line: keep the partial last line for the next poll.
+        complete = tail[: tail.rfind(b"\n") + 1]
+        self.offset = max(self.offset, len(header)) + len(complete)
+        if not complete:
+            return None, False
+        return pd.read_csv(io.BytesIO(header + complete), **CSV_OPTIONS), False
+
+
+def live_layout() -> dict[str, Any]:
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=3, cols=1, subplot_titles=["Trend", "Mix", "Correlation"])
+    fig.update_layout(height=1200, title_text="Business Dashboard", template="plotly_white", barmode="group")
+    return json.loads(fig.to_json())["layout"]
+
+
+def serve_dashboard(
+    source: Path,
+    host: str = "127.0.0.1",
+    port: int = 8050,
+    interval: float = 1.0,
+    window: int = 0,
+    plotly_js: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    regions: list[str] | None = None,
+) -> None:
+    import plotly.offline
+
+    tail = SourceTail(source)
+    live = LiveDashboard(live_layout(), window)
+    initial = tail.initial()
+    if initial is not None:
+        live.apply(filter_frame(initial, start, end, regions))
+    bundle = plotly.offline.get_plotlyjs().encode() if plotly_js is None else b""
+    page = LIVE_SHELL.format(title="Business Dashboard", plotly_js=html.escape(plotly_js or "plotly.min.js")).encode()
+    clients = [0]
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def reply(self, body: bytes, content_type: str, cache: str = "no-cache") -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", cache)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == "/":
+                self.reply(page, "text/html; charset=utf-8")
+            elif url.path == "/plotly.min.js" and bundle:
+                self.reply(bundle, "text/javascript", "public, max-age=86400")
+            elif url.path == "/figure.json":
+                self.reply(live.snapshot().encode(), "application/json")
+            elif url.path == "/events":
+                since = self.headers.get("Last-Event-ID") or parse_qs(url.query).get("since", ["0"])[0]
+                try:
+                    since = max(0, int(since))
+                except ValueError:  # a malformed id replays from the start, like a new client
+                    since = 0
+                self.stream(since)
+            else:
+                self.send_error(404)
+
+        def stream(self, since: int) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            clients[0] += 1
+            try:
+                while True:
+                    events = live.wait(since, timeout=15.0)
+                    if events is None:
+                        self.wfile.write(b'data: {"op":"reload"}\n\n')
+                        self.wfile.flush()
+                        return
+                    if not events:
+                        self.wfile.write(b": keepalive\n\n")
+                    for seq, data in events:
+                        self.wfile.write(f"id: {seq}\ndata: {data}\n\n".encode())
+                        since = seq
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                clients[0] -= 1
+
+    def watch() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                df, truncated = tail.poll()
+            except (OSError, ValueError) as exc:
+                print(f"  [tail] skipped poll: {exc}")
+                continue
+            if truncated:
+                live.reset(live_layout())
+                df, _ = tail.poll()
+                if df is not None:
+                    live.apply(filter_frame(df, start, end, regions))
+                live.publish([{"op": "reload"}])
+                print("  [tail] source truncated; rebuilt and asked clients to reload")
+            elif df is not None:
+                ops = live.apply(filter_frame(df, start, end, regions))
+                live.publish(ops)
+                print(f"  [tail] +{len(df)} rows -> {len(ops)} update(s) to {clients[0]} client(s)")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=watch, daemon=True).start()
+    points = sum(len(trace["x"]) for trace in live.figure["data"] if trace["type"] != "bar")
+    url = f"http://{host}:{server.server_address[1]}/"
+    print(f"  [serve] {url}  ({points} points in {len(live.figure['data'])} traces)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("csv", type=Path, help="Input CSV path")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="Input CSV, Parquet, Arrow/Feather file or Parquet dataset directory")
     parser.add_argument("--out", type=Path, default=Path("dashboard.html"), help="Output HTML path")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day to include (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day to include (YYYY-MM-DD)")
+    parser.add_argument("--region", action="append", dest="regions", help="Region to include (repeatable)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--large", action="store_true", help="Chunked read, downsampling and WebGL traces")
+    mode.add_argument("--incremental", action="store_true", help="Rebuild from cached per-partition aggregates")
+    mode.add_argument("--serve", action="store_true", help="Serve a live dashboard that streams appended rows")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="Incremental mode: aggregate cache file")
+    parser.add_argument("--max-points", type=int, default=2000, help="Large mode: points per trend series")
+    parser.add_argument("--downsample", choices=DOWNSAMPLERS, default="lttb", help="Large mode: trend downsampler")
+    parser.add_argument("--max-scatter-points", type=int, default=20_000, help="Large mode: scatter sample size")
+    parser.add_argument("--chunksize", type=int, default=500_000, help="Rows per chunk when streaming")
+    parser.add_argument("--payload", action="store_true", help="Write an HTML shell plus <out>.json.gz payload")
+    parser.add_argument("--plotly-js", help="Payload/serve mode: plotly.js URL (default: shared file next to --out)")
+    parser.add_argument("--host", default="127.0.0.1", help="Serve mode: bind address")
+    parser.add_argument("--port", type=int, default=8050, help="Serve mode: port")
+    parser.add_argument("--interval", type=float, default=1.0, help="Serve mode: seconds between source polls")
+    parser.add_argument("--window", type=int, default=0, help="Serve mode: points kept per trace (0 = all)")
     args = parser.parse_args()
 
-    build_dashboard(args.csv, args.out)
+    filters = {"start": args.start, "end": args.end, "regions": args.regions}
+    if args.serve:
+        serve_dashboard(args.source, args.host, args.port, args.interval, args.window, args.plotly_js, **filters)
+        return
+    if args.large:
+        fig = build_large_dashboard(
+            args.source, args.max_points, args.downsample, args.max_scatter_points, args.chunksize, **filters
+        )
+    elif args.incremental:
+        fig = build_incremental_dashboard(args.source, args.cache, args.chunksize, **filters)
+    else:
+        fig = load_dashboard_figure(args.source, **filters)
+    write_dashboard(fig, args.out, args.payload, args.plotly_js)
     print(f"Dashboard saved to {args.out}")
 
 
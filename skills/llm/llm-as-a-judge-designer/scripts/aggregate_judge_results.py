@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Aggregate many judge results into one summary report using columnar NumPy arrays.
+
+Reads `judge_result.json` files, batch JSONL outputs of run_llm_judge.py, or
+directories containing them (searched for `judge_result*.json` and `*.jsonl`; other JSON
+such as schemas or this script's own summary is ignored, as are objects that carry
+neither `final_verdict` nor `criteria`). Computes weighted overall scores, per-criterion means
+and variances, verdict and hard-fail rates, and bootstrap confidence intervals.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from run_llm_judge import DEFAULT_RUBRIC, load_json
+
+VERDICTS = ("pass", "needs_revision", "fail")
+# Bootstrap resamples are drawn in blocks of at most this many indices to bound memory.
+BOOTSTRAP_BLOCK = 4_000_000
+
+
+def is_judge_result(obj: Any) -> bool:
+    return isinstance(obj, dict) and ("final_verdict" in obj or "criteria" in obj)
+
+
+def iter_results(paths: list[Path]) -> Iterator[dict[str, Any]]:
+    for path in paths:
+        if path.is_dir():
+            found = set(path.rglob("judge_result*.json")) | set(path.rglob("*.jsonl"))
+            yield from iter_results(sorted(found))
+        elif path.suffix == ".jsonl":
+            with path.open() as handle:
+                for line in handle:
+                    if line.strip():
+                        row = json.loads(line)
+                        # Error rows of batch runs carry no verdict; other JSONL rows are not results.
+                        if isinstance(row, dict) and is_judge_result(row.get("result")):
+                            yield row["result"]
+        else:
+            result = load_json(path)
+            if is_judge_result(result):
+                yield result
+            else:
+                print(f"  [skip] {path}: not a judge result (no final_verdict or criteria)")
+
+
+def load_columns(results: Iterator[dict[str, Any]], criteria: list[str]) -> dict[str, np.ndarray]:
+    """Load results into columns: scores (n x criteria, NaN where missing), overall, verdict, hard_fail."""
+    scores: list[list[float]] = []
+    overall: list[float] = []
+    verdicts: list[int] = []
+    hard_fail: list[bool] = []
+    for result in results:
+        per_criterion = result.get("criteria", {})
+        scores.append([per_criterion.get(name, {}).get("score", np.nan) for name in criteria])
+        overall.append(result.get("overall_score", np.nan))
+        verdict = result.get("final_verdict")
+        verdicts.append(VERDICTS.index(verdict) if verdict in VERDICTS else -1)
+        hard_fail.append(bool(result.get("hard_fail", False)))
+    return {
+        "scores": np.array(scores, dtype=np.float64).reshape(len(scores), len(criteria)),
+        "overall": np.array(overall, dtype=np.float64),
+        "verdict": np.array(verdicts, dtype=np.int8),
+        "hard_fail": np.array(hard_fail, dtype=bool),
+    }
+
+
+def bootstrap_means(
+    columns: np.ndarray, resamples: int, confidence: float, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Percentile bootstrap CI of the (NaN-aware) mean of every column of an (n x k) array.
+
+    Each resample is expressed as a vector of draw counts, so the means of a whole block
+    of resamples are one matrix product instead of a gather per resample.
+    """
+    n = columns.shape[0]
+    present = (~np.isnan(columns)).astype(np.float64)
+    values = np.nan_to_num(columns)
+    block = max(1, BOOTSTRAP_BLOCK // max(1, n))
+    means = []
+    for start in range(0, resamples, block):
+        size = min(block, resamples - start)
+        draws = rng.integers(0, n, size=(size, n)) + (np.arange(size) * n)[:, None]
+        counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means.append((counts @ values) / (counts @ present))  # (size x k)
+    stacked = np.concatenate(means, axis=0)
+    tail = (1 - confidence) / 2 * 100
+    low = np.full(columns.shape[1], np.nan)
+    high = np.full(columns.shape[1], np.nan)
+    filled = present.any(axis=0)  # all-NaN columns have no interval (and would warn)
+    low[filled] = np.nanpercentile(stacked[:, filled], tail, axis=0)
+    high[filled] = np.nanpercentile(stacked[:, filled], 100 - tail, axis=0)
+    return low, high
+
+
+def column_stats(columns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """NaN-aware mean and sample variance of every column of an (n x k) array.
+
+    Columns without values get NaN for both, a single value gets variance 0, and neither
+    case emits numpy's empty-slice warnings."""
+    counts = (~np.isnan(columns)).sum(axis=0)
+    means = np.full(columns.shape[1], np.nan)
+    variances = np.where(counts == 1, 0.0, np.nan)
+    filled, several = counts > 0, counts > 1
+    means[filled] = np.nanmean(columns[:, filled], axis=0)
+    variances[several] = np.nanvar(columns[:, several], axis=0, ddof=1)
+    return means, variances
+
+
+def rounded(value: float, digits: int = 4) -> float | None:
+    """Round for the JSON report; NaN (no data) becomes null instead of a bare NaN token."""
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def summarize(
+    columns: dict[str, np.ndarray],
+    rubric: dict[str, float],
+    pass_threshold: float,
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> dict[str, Any]:
+    criteria = list(rubric)
+    scores = columns["scores"]
+    n = scores.shape[0]
+    if n == 0:
+        return {"samples": 0}
+
+    weights = np.array([rubric[name] for name in criteria], dtype=np.float64)
+    # Weighted overall over the criteria each sample actually has, renormalized by their weight.
+    present = ~np.isnan(scores)
+    weighted = np.where(present, scores, 0.0) @ weights
+    weight_sum = present @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        recomputed = np.where(weight_sum > 0, weighted / weight_sum, np.nan)
+    passed = (recomputed >= pass_threshold) & ~columns["hard_fail"]
+
+    stats = np.column_stack([recomputed, passed.astype(np.float64), scores])
+    low, high = bootstrap_means(stats, resamples, confidence, np.random.default_rng(seed))
+    means, variances = column_stats(scores)
+    (overall_mean,), (overall_var,) = column_stats(recomputed[:, None])
+    (reported_mean,), _ = column_stats(columns["overall"][:, None])
+
+    def interval(i: int) -> list[float | None]:
+        return [rounded(low[i]), rounded(high[i])]
+
+    verdict_counts = np.bincount(columns["verdict"][columns["verdict"] >= 0], minlength=len(VERDICTS))
+    return {
+        "samples": n,
+        "confidence": confidence,
+        "bootstrap_resamples": resamples,
+        "overall": {
+            "mean": rounded(overall_mean),
+            "std": rounded(np.sqrt(overall_var)),
+            "ci": interval(0),
+            "reported_mean": rounded(reported_mean),
+        },
+        "pass_rate": {"threshold": pass_threshold, "rate": round(float(passed.mean()), 4), "ci": interval(1)},
+        "hard_fail_rate": round(float(columns["hard_fail"].mean()), 4),
+        "verdicts": {name: int(count) for name, count in zip(VERDICTS, verdict_counts)},
+        "criteria": {
+            name: {
+                "weight": rubric[name],
+                "mean": rounded(means[i]),
+                "variance": rounded(variances[i], 6),
+                "ci": interval(i + 2),
+                "missing": int((~present[:, i]).sum()),
+            }
+            for i, name in enumerate(criteria)
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("inputs", nargs="+", type=Path, help="judge_result.json files, JSONL outputs or directories")
+    parser.add_argument("--rubric", type=Path, help="Optional rubric JSON file with criterion weights")
+    parser.add_argument("--pass-threshold", type=float, default=0.75, help="Weighted score needed to pass")
+    parser.add_argument("--resamples", type=int, default=1000, help="Bootstrap resamples")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level of intervals")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("judge_summary.json"))
+    args = parser.parse_args()
+
+    rubric = load_json(args.rubric) if args.rubric else DEFAULT_RUBRIC
+    columns = load_columns(iter_results(args.inputs), list(rubric))
+    summary = summarize(columns, rubric, args.pass_threshold, args.resamples, args.confidence, args.seed)
+    args.output.write_text(json.dumps(summary, indent=2))
+
+    if not summary["samples"]:
+        print(f"No judge results found; empty summary written to {args.output}")
+        return
+
+    def fmt(value: float | None, spec: str = ".4f") -> str:
+        return "n/a" if value is None else format(value, spec)
+
+    overall = summary["overall"]
+    print(f"Samples: {summary['samples']}")
+    print(f"Overall: {fmt(overall['mean'])} (CI {fmt(overall['ci'][0])}-{fmt(overall['ci'][1])})")
+    print(f"Pass rate: {summary['pass_rate']['rate']:.2%}  Hard fails: {summary['hard_fail_rate']:.2%}")
+    for name, stats in summary["criteria"].items():
+        print(f"  {name:<24} mean {fmt(stats['mean'])}  var {fmt(stats['variance'], '.6f')}")
+    print(f"Summary written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Benchmark judge throughput without calling a real provider.
+
+Replaces `call_external_judge` in run_llm_judge.py with a stub transport that answers
+after a configurable latency (plus uniform jitter) and fails at a configurable rate,
+then runs the real batch pipeline at several concurrency levels. Reports judgments
+per second, p50/p95/p99 latency per judgment and the schema-validation overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import run_llm_judge
+from run_llm_judge import (
+    DEFAULT_RUBRIC,
+    VALIDATOR_BACKENDS,
+    BatchJob,
+    JudgeTransport,
+    get_validator,
+    load_json,
+    run_batch,
+)
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parent.parent / "assets" / "judge-output-schema.json"
+
+
+def make_stub_transport(latency_ms: float, jitter_ms: float, error_rate: float, seed: int) -> JudgeTransport:
+    rng = random.Random(seed)
+
+    async def stub_judge(prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000)
+        if rng.random() < error_rate:
+            raise ConnectionError("stub transport error")
+        return run_llm_judge.local_fallback_judge(prompt, DEFAULT_RUBRIC)
+
+    return stub_judge
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def write_candidates(path: Path, samples: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with path.open("w") as handle:
+        for i in range(samples):
+            text = "Candidate answer " + "lorem ipsum " * rng.randint(2, 40)
+            handle.write(json.dumps({"id": i, "task": "Answer the question.", "candidate": text}) + "\n")
+
+
+def run_level(candidates: Path, output: Path, schema: dict[str, Any], concurrency: int, backend: str) -> dict[str, Any]:
+    latencies: list[float] = []
+    evaluate = run_llm_judge.evaluate
+
+    async def timed_evaluate(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            return await evaluate(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    job = BatchJob(schema=schema, rubric=DEFAULT_RUBRIC, use_local_fallback=False, validator_backend=backend)
+    run_llm_judge.evaluate = timed_evaluate
+    try:
+        started = time.perf_counter()
+        counts = asyncio.run(run_batch(candidates, output, job, concurrency))
+        elapsed = time.perf_counter() - started
+    finally:
+        run_llm_judge.evaluate = evaluate
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "judged": counts["judged"],
+        "errors": counts["errors"],
+        "seconds": round(elapsed, 3),
+        "throughput": round((counts["judged"] + counts["errors"]) / elapsed, 2),
+        "latency_ms": {f"p{q}": round(percentile(latencies, q), 2) for q in (50, 95, 99)},
+    }
+
+
+def validation_overhead(schema: dict[str, Any], backend: str, rounds: int) -> float:
+    """Mean microseconds per validation of a typical verdict with the cached validator."""
+    validate = get_validator(schema, backend)
+    result = run_llm_judge.local_fallback_judge("x" * 100, DEFAULT_RUBRIC)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        validate(result)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA, help="Judge output schema JSON file")
+    parser.add_argument("--samples", type=int, default=200, help="Candidates judged per concurrency level")
+    parser.add_argument("--concurrency", default="1,8,32,128", help="Comma-separated concurrency levels")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub judge mean latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Uniform +/- jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub calls that fail")
+    parser.add_argument("--validator-backend", choices=VALIDATOR_BACKENDS, default="auto")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Optional JSON report file")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    schema = load_json(args.schema)
+    run_llm_judge.call_external_judge = make_stub_transport(
+        args.latency_ms, args.jitter_ms, args.error_rate, args.seed
+    )
+
+    overhead_us = validation_overhead(schema, args.validator_backend, rounds=2000)
+    print(
+        f"Stub judge: {args.latency_ms:.0f} +/- {args.jitter_ms:.0f} ms, error rate {args.error_rate:.1%}; "
+        f"{args.samples} candidates per level"
+    )
+    print(f"Schema validation: {overhead_us:.1f} us per verdict ({args.validator_backend})")
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        candidates = Path(tmp) / "candidates.jsonl"
+        write_candidates(candidates, args.samples, args.seed)
+        for level in levels:
+            run = run_level(candidates, Path(tmp) / "results.jsonl", schema, level, args.validator_backend)
+            latency = run["latency_ms"]
+            # Share of a median judgment spent validating the verdict.
+            run["validation_share"] = round(overhead_us / 1000 / latency["p50"], 6) if latency["p50"] else 0.0
+            runs.append(run)
+            print(
+                f"  [c={level}] {run['throughput']:.1f} judgments/s  p50 {latency['p50']:.1f} ms  "
+                f"p95 {latency['p95']:.1f} ms  p99 {latency['p99']:.1f} ms  errors {run['errors']}  "
+                f"validation {run['validation_share']:.3%}"
+            )
+
+    if args.output:
+        report = {
+            "stub": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate},
+            "samples": args.samples,
+            "validator_backend": args.validator_backend,
+            "validation_us": round(overhead_us, 2),
+            "runs": runs,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Benchmark report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
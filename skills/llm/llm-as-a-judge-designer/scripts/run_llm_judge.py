@@ -3,18 +3,54 @@
 
 This script includes a deterministic local fallback judge for environments without
 an online LLM provider. Replace `call_external_judge` with your provider client.
+
+`--batch candidates.jsonl` streams candidates (one JSON object per line with
+`candidate`, optional `id` and `task`), judges them concurrently under
+`--concurrency` and `--rate-limit`, and streams results to a JSONL file as they finish.
+With `--checkpoint judged.sqlite` the run is resumable: results are appended, the
+output keeps one row per candidate key, and failed candidates go to
+`<output stem>.errors.jsonl` and are retried on the next run.
+
+Each distinct schema is compiled once into a cached validator (LRU, keyed by schema
+hash); `fastjsonschema` is used as a faster backend when installed and the schema declares
+draft-04, -06 or -07 (it implements no other drafts); the schema itself is always checked.
+
+`--ensemble N` (or `--ensemble-weights 1,1,2`) asks several judges concurrently and
+takes a majority (weighted) vote, cancelling the remaining calls once they can no longer
+change the outcome. `--candidate-b` (or `candidate_b` in batch records) switches to
+pairwise A/B comparison; use assets/pairwise-output-schema.json as --schema.
+
+`--cache verdicts.sqlite` stores external judge verdicts keyed by task, candidate,
+rubric, schema and JUDGE_PROMPT_VERSION, so repeat evaluations skip the judge call.
+Ensemble and pairwise runs are uncached: every member must be an independent sample,
+and one cached verdict replayed to all of them would turn the vote into a copy.
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
+import os
+import socket
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator
 
 import jsonschema
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# Bump when the judge prompt changes: it invalidates every cached verdict.
+JUDGE_PROMPT_VERSION = "1"
 
 DEFAULT_RUBRIC = {
     "task_success": 0.2,
@@ -26,6 +62,63 @@ DEFAULT_RUBRIC = {
 }
 
 
+VALIDATOR_BACKENDS = ("auto", "jsonschema", "fastjsonschema")
+FASTJSONSCHEMA_DRAFTS = ("draft-04", "draft-06", "draft-07")
+VALIDATOR_CACHE_SIZE = 32
+_validators: OrderedDict[tuple[str, str], Callable[[Any], None]] = OrderedDict()
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def content_hash(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def fastjsonschema_supports(schema: dict[str, Any]) -> bool:
+    """fastjsonschema implements drafts 4, 6 and 7 only; other drafts (or none declared) go to jsonschema."""
+    declared = schema.get("$schema", "")
+    return isinstance(declared, str) and any(draft in declared for draft in FASTJSONSCHEMA_DRAFTS)
+
+
+def compile_validator(schema: dict[str, Any], backend: str) -> Callable[[Any], None]:
+    if backend == "fastjsonschema" and fastjsonschema is None:
+        raise RuntimeError("fastjsonschema is not installed")
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    use_fast = backend == "fastjsonschema" or (backend == "auto" and fastjsonschema_supports(schema))
+    if use_fast and fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(instance: Any) -> None:
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaException as exc:
+                # Keep one exception type for callers regardless of backend.
+                raise jsonschema.ValidationError(exc.message) from exc
+
+        return validate
+
+    return cls(schema).validate
+
+
+def get_validator(schema: dict[str, Any], backend: str = "auto") -> Callable[[Any], None]:
+    """Return a compiled validator for schema, compiling each distinct schema only once."""
+    key = (schema_hash(schema), backend)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = compile_validator(schema, backend)
+        _validators[key] = validator
+        if len(_validators) > VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    else:
+        _validators.move_to_end(key)
+    return validator
+
+
 def local_fallback_judge(candidate_output: str, rubric: dict[str, float]) -> dict[str, Any]:
     length_score = 0.9 if len(candidate_output) > 80 else 0.6
     criteria = {}
@@ -55,59 +148,656 @@ async def call_external_judge(prompt: str, schema: dict[str, Any]) -> dict[str,
     raise NotImplementedError("Integrate your LLM provider in call_external_judge")
 
 
+def build_judge_prompt(task: str, candidate_output: str, rubric: dict[str, float]) -> str:
+    return (
+        "Evaluate candidate output against task and rubric. "
+        "Return strict JSON only according to the schema.\n"
+        f"Task:\n{task}\n\n"
+        f"Candidate output:\n{candidate_output}\n\n"
+        f"Rubric:\n{json.dumps(rubric, indent=2)}"
+    )
+
+
+class VerdictCache:
+    """Persistent SQLite cache of validated judge verdicts.
+
+    Entries expire after `ttl_seconds` (0 = never); when more than `max_entries` are
+    stored, the least recently used ones are evicted. Safe to share between processes.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float = 0.0, max_entries: int = 100_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS verdicts_accessed ON verdicts (accessed_at)")
+        if ttl_seconds > 0:
+            self._db.execute("DELETE FROM verdicts WHERE created_at < ?", (time.time() - ttl_seconds,))
+        self._size = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    @staticmethod
+    def key(task: str, candidate_output: str, rubric: dict[str, float], schema: dict[str, Any]) -> str:
+        return content_hash(
+            {
+                "prompt_version": JUDGE_PROMPT_VERSION,
+                "task": task,
+                "candidate": candidate_output,
+                "rubric": rubric,
+                "schema": schema,
+            }
+        )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = time.time()
+        row = self._db.execute("SELECT result, created_at FROM verdicts WHERE key = ?", (key,)).fetchone()
+        if row is not None and self.ttl_seconds > 0 and row[1] < now - self.ttl_seconds:
+            self._db.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._db.execute("UPDATE verdicts SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        now = time.time()
+        cursor = self._db.execute(
+            "INSERT OR IGNORE INTO verdicts (key, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(result, separators=(",", ":")), now, now),
+        )
+        self._size += cursor.rowcount
+        if self._size > self.max_entries:
+            # Evict down to 90% so eviction runs once per many inserts, not on every one.
+            keep = int(self.max_entries * 0.9)
+            self._db.execute(
+                "DELETE FROM verdicts WHERE key IN"
+                " (SELECT key FROM verdicts ORDER BY accessed_at LIMIT max(0, (SELECT COUNT(*) FROM verdicts) - ?))",
+                (keep,),
+            )
+            self._size = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
 async def evaluate(
     task: str,
     candidate_output: str,
     schema: dict[str, Any],
     rubric: dict[str, float],
     use_local_fallback: bool,
+    validator_backend: str = "auto",
+    cache: VerdictCache | None = None,
+    limiter: RateLimiter | None = None,
 ) -> dict[str, Any]:
     if use_local_fallback:
         result = local_fallback_judge(candidate_output, rubric)
-    else:
-        prompt = (
-            "Evaluate candidate output against task and rubric. "
-            "Return strict JSON only according to the schema.\n"
-            f"Task:\n{task}\n\n"
-            f"Candidate output:\n{candidate_output}\n\n"
-            f"Rubric:\n{json.dumps(rubric, indent=2)}"
-        )
-        result = await call_external_judge(prompt, schema)
+        get_validator(schema, validator_backend)(result)
+        return result
 
-    jsonschema.validate(result, schema)
+    key = VerdictCache.key(task, candidate_output, rubric, schema) if cache is not None else ""
+    if cache is not None and (cached := cache.get(key)) is not None:
+        return cached  # validated before it was stored
+
+    if limiter is not None:
+        await limiter.wait()  # only calls that reach the judge count against the rate limit
+    result = await call_external_judge(build_judge_prompt(task, candidate_output, rubric), schema)
+    get_validator(schema, validator_backend)(result)
+    if cache is not None:
+        cache.put(key, result)
     return result
 
 
+JudgeTransport = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+# Per vote field: tie-break order (the more conservative label wins a tied vote) and
+# the score used to pick the representative result among the agreeing judges.
+VOTE_FIELDS = {
+    "final_verdict": (("fail", "needs_revision", "pass"), "overall_score"),
+    "winner": (("tie", "a", "b"), "confidence"),
+}
+
+
+def build_pairwise_prompt(task: str, candidate_a: str, candidate_b: str, rubric: dict[str, float]) -> str:
+    return (
+        "Compare two candidate outputs for the same task against the rubric. "
+        'Return strict JSON only according to the schema; winner is "a", "b" or "tie".\n'
+        f"Task:\n{task}\n\n"
+        f"Candidate A:\n{candidate_a}\n\n"
+        f"Candidate B:\n{candidate_b}\n\n"
+        f"Rubric:\n{json.dumps(rubric, indent=2)}"
+    )
+
+
+def local_pairwise_judge(candidate_a: str, candidate_b: str, rubric: dict[str, float]) -> dict[str, Any]:
+    score_a = local_fallback_judge(candidate_a, rubric)["overall_score"]
+    score_b = local_fallback_judge(candidate_b, rubric)["overall_score"]
+    winner = "tie" if score_a == score_b else ("a" if score_a > score_b else "b")
+    return {
+        "winner": winner,
+        "confidence": round(abs(score_a - score_b), 4),
+        "rationale": "Local fallback comparison of heuristic scores.",
+    }
+
+
+async def external_transport(prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
+    # Resolved at call time, so a replaced call_external_judge is picked up.
+    return await call_external_judge(prompt, schema)
+
+
+def decide(votes: dict[str, float], vote_key: str) -> str:
+    order = VOTE_FIELDS[vote_key][0]
+    return min(votes, key=lambda label: (-votes[label], order.index(label) if label in order else len(order)))
+
+
+async def run_ensemble(
+    prompt: str,
+    schema: dict[str, Any],
+    transports: list[JudgeTransport],
+    weights: list[float],
+    vote_key: str,
+    validator_backend: str = "auto",
+    limiter: RateLimiter | None = None,
+) -> dict[str, Any]:
+    """Call all judges concurrently and vote on result[vote_key].
+
+    Stops as soon as the leading label is ahead by more than the weight of the judges
+    still pending; those calls are cancelled. Judges that fail or return invalid JSON
+    cast no vote.
+    """
+    validate = get_validator(schema, validator_backend)
+
+    async def call(transport: JudgeTransport) -> dict[str, Any]:
+        if limiter is not None:
+            await limiter.wait()
+        return await transport(prompt, schema)
+
+    tasks = {asyncio.ensure_future(call(transport)): i for i, transport in enumerate(transports)}
+    pending = set(tasks)
+    remaining = float(sum(weights))
+    votes: dict[str, float] = {}
+    members: list[tuple[int, dict[str, Any]]] = []
+    errors: list[dict[str, Any]] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i = tasks[task]
+                remaining -= weights[i]
+                try:
+                    result = task.result()
+                    validate(result)
+                    label = result[vote_key]  # the schema may not require the vote field
+                    if not isinstance(label, str):
+                        raise TypeError(f"{vote_key} must be a string, got {type(label).__name__}")
+                except Exception as exc:
+                    errors.append({"judge": i, "error": f"{type(exc).__name__}: {exc}"})
+                    continue
+                votes[label] = votes.get(label, 0.0) + weights[i]
+                members.append((i, result))
+            ranked = sorted(votes.values(), reverse=True) + [0.0, 0.0]
+            if pending and ranked[0] > ranked[1] + remaining:
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if not votes:
+        raise RuntimeError(f"all {len(transports)} judges failed; first error: {errors[0]['error']}")
+    decision = decide(votes, vote_key)
+    score_key = VOTE_FIELDS[vote_key][1]
+    agreeing = sorted((r for _, r in members if r[vote_key] == decision), key=lambda r: r.get(score_key, 0))
+    return {
+        "result": agreeing[(len(agreeing) - 1) // 2],  # median by score among the majority
+        "ensemble": {
+            "vote": vote_key,
+            "decision": decision,
+            "votes": votes,
+            "judges": len(transports),
+            "responded": len(members),
+            "cancelled": len(pending),
+            "members": [{"judge": i, "weight": weights[i], "vote": r[vote_key]} for i, r in sorted(members)],
+            "errors": errors,
+        },
+    }
+
+
+async def evaluate_ensemble(
+    task: str,
+    candidate_output: str,
+    schema: dict[str, Any],
+    rubric: dict[str, float],
+    use_local_fallback: bool,
+    weights: list[float],
+    candidate_b: str | None = None,
+    validator_backend: str = "auto",
+    transports: list[JudgeTransport] | None = None,
+    limiter: RateLimiter | None = None,
+) -> dict[str, Any]:
+    """Judge one candidate (or an A/B pair when candidate_b is given) with len(weights) judges.
+
+    Pass `transports` to fan out to different providers or models; by default every
+    judge is call_external_judge. Ensemble members bypass the verdict cache on purpose.
+    """
+    if candidate_b is None:
+        prompt = build_judge_prompt(task, candidate_output, rubric)
+    else:
+        prompt = build_pairwise_prompt(task, candidate_output, candidate_b, rubric)
+    if transports is None:
+        if use_local_fallback:
+
+            async def local_transport(prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
+                if candidate_b is None:
+                    return local_fallback_judge(candidate_output, rubric)
+                return local_pairwise_judge(candidate_output, candidate_b, rubric)
+
+            transports = [local_transport] * len(weights)
+        else:
+            transports = [external_transport] * len(weights)
+    if len(transports) != len(weights):
+        raise ValueError(f"{len(transports)} transports but {len(weights)} weights")
+    vote_key = "final_verdict" if candidate_b is None else "winner"
+    return await run_ensemble(prompt, schema, transports, weights, vote_key, validator_backend, limiter)
+
+
 def load_json(path: Path) -> dict[str, Any]:
     return json.loads(path.read_text())
 
 
+class RateLimiter:
+    """Spaces call starts so that at most `rate` calls begin per second (0 = unlimited)."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def iter_lines(path: Path) -> Iterator[tuple[int, str]]:
+    with path.open() as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if line.strip():
+                yield line_no, line
+
+
+def judgement_key(task: str, candidate_output: str, rubric: dict[str, float]) -> str:
+    return ":".join((content_hash(task), content_hash(candidate_output), content_hash(rubric)))
+
+
+class CheckpointStore:
+    """SQLite record of judged (task, candidate-hash, rubric-hash) keys.
+
+    Workers claim a key before judging it, so several processes can share one store:
+    a key that is done, or claimed by a live worker, is skipped. Claims of dead local
+    processes are dropped on open; other claims older than `claim_timeout` seconds can
+    be taken over.
+    """
+
+    def __init__(self, path: Path, claim_timeout: float = 600.0) -> None:
+        self.claim_timeout = claim_timeout
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        self._db = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS judged ("
+            " key TEXT PRIMARY KEY, status TEXT NOT NULL, worker TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._release_dead_local_claims()
+
+    def _release_dead_local_claims(self) -> None:
+        host = socket.gethostname()
+        rows = self._db.execute("SELECT DISTINCT worker FROM judged WHERE status = 'claimed'").fetchall()
+        for (worker,) in rows:
+            worker_host, _, pid = worker.rpartition(":")
+            if worker_host != host or not pid.isdigit():
+                continue
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                self._db.execute("DELETE FROM judged WHERE status = 'claimed' AND worker = ?", (worker,))
+            except PermissionError:
+                pass  # alive, owned by another user
+
+    def claim(self, key: str) -> bool:
+        now = time.time()
+        cursor = self._db.execute(
+            "INSERT INTO judged (key, status, worker, updated_at) VALUES (?, 'claimed', ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET worker = excluded.worker, updated_at = excluded.updated_at"
+            " WHERE judged.status = 'claimed' AND judged.updated_at < ?",
+            (key, self.worker, now, now - self.claim_timeout),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, key: str) -> None:
+        self._db.execute(
+            "UPDATE judged SET status = 'done', updated_at = ? WHERE key = ? AND worker = ?",
+            (time.time(), key, self.worker),
+        )
+
+    def mark_done(self, key: str) -> None:
+        """Record a key as judged without a claim, e.g. when its row is already in the output."""
+        self._db.execute(
+            "INSERT INTO judged (key, status, worker, updated_at) VALUES (?, 'done', ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET status = 'done', updated_at = excluded.updated_at",
+            (key, self.worker, time.time()),
+        )
+
+    def release(self, key: str) -> None:
+        self._db.execute("DELETE FROM judged WHERE key = ? AND status = 'claimed' AND worker = ?", (key, self.worker))
+
+    def close(self) -> None:
+        self._db.close()
+
+
+@dataclass
+class BatchJob:
+    schema: dict[str, Any]
+    rubric: dict[str, float]
+    use_local_fallback: bool
+    default_task: str | None = None
+    validator_backend: str = "auto"
+    limiter: RateLimiter = field(default_factory=lambda: RateLimiter(0.0))
+    checkpoint: CheckpointStore | None = None
+    cache: VerdictCache | None = None
+    ensemble_weights: list[float] = field(default_factory=lambda: [1.0])
+    # Keys that already have a result row in the output file.
+    written_keys: set[str] = field(default_factory=set)
+
+
+async def judge_line(line_no: int, line: str, job: BatchJob) -> dict[str, Any] | None:
+    """Judge one JSONL record; returns None when the checkpoint says it is already judged."""
+    record_id: Any = line_no
+    key = None
+    try:
+        record = json.loads(line)
+        record_id = record.get("id", line_no)
+        task = record.get("task", job.default_task)
+        if task is None:
+            raise ValueError("no 'task' in record and no --task given")
+        candidate = record["candidate"]
+        candidate_b = record.get("candidate_b")
+        if job.checkpoint is not None:
+            key = judgement_key(task, candidate if candidate_b is None else f"{candidate}\0{candidate_b}", job.rubric)
+            if key in job.written_keys:
+                job.checkpoint.mark_done(key)  # written, but the run died before it was marked done
+                return None
+            if not job.checkpoint.claim(key):
+                return None
+        ensemble = None
+        if len(job.ensemble_weights) > 1 or candidate_b is not None:
+            outcome = await evaluate_ensemble(
+                task,
+                candidate,
+                job.schema,
+                job.rubric,
+                job.use_local_fallback,
+                job.ensemble_weights,
+                candidate_b,
+                job.validator_backend,
+                limiter=job.limiter,  # rate-limit every judge call, not every record
+            )
+            result, ensemble = outcome["result"], outcome["ensemble"]
+        else:
+            result = await evaluate(
+                task,
+                candidate,
+                job.schema,
+                job.rubric,
+                job.use_local_fallback,
+                job.validator_backend,
+                job.cache,
+                limiter=job.limiter,
+            )
+    except Exception as exc:  # one bad sample must not abort a long batch
+        if key is not None and job.checkpoint is not None:
+            job.checkpoint.release(key)
+        row = {"id": record_id, "error": f"{type(exc).__name__}: {exc}"}
+        if key is not None:
+            row["key"] = key
+        return row
+    row = {"id": record_id, "result": result}
+    if len(job.ensemble_weights) > 1:
+        row["ensemble"] = ensemble
+    if key is not None:
+        row["key"] = key
+    return row
+
+
+def errors_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.errors.jsonl")
+
+
+def result_keys(output_path: Path) -> set[str]:
+    """Keys of the result rows already in a checkpointed output file.
+
+    A row cut off by a crash mid-write is truncated away, so the next append starts on a
+    fresh line."""
+    keys: set[str] = set()
+    try:
+        handle = output_path.open("r+b")
+    except FileNotFoundError:
+        return keys
+    with handle:
+        end = 0
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(row, dict) and "result" in row and "key" in row:
+                keys.add(row["key"])
+        handle.truncate(end)
+    return keys
+
+
+async def run_batch(input_path: Path, output_path: Path, job: BatchJob, concurrency: int = 8) -> dict[str, int]:
+    """Judge a JSONL file with bounded parallelism; memory stays flat regardless of input size.
+
+    With a checkpoint store, results are appended to output_path and already judged
+    candidates are skipped, so an interrupted run can simply be restarted. The output
+    then holds one row per key: keys whose row is already in it are skipped even if the
+    store missed them, and error rows go to `<stem>.errors.jsonl` (rewritten every run,
+    since failed candidates are retried) instead of the output.
+    """
+    queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=concurrency * 2)
+    counts = {"judged": 0, "errors": 0, "skipped": 0}
+    if job.checkpoint is not None:
+        job.written_keys |= result_keys(output_path)
+    errors_out = None
+
+    with output_path.open("a" if job.checkpoint else "w") as out:
+
+        async def worker() -> None:
+            nonlocal errors_out
+            while (item := await queue.get()) is not None:
+                row = await judge_line(*item, job)
+                if row is None:
+                    counts["skipped"] += 1
+                    continue
+                counts["errors" if "error" in row else "judged"] += 1
+                line = json.dumps(row, ensure_ascii=True) + "\n"
+                if job.checkpoint is None:
+                    out.write(line)
+                elif "error" in row:
+                    if errors_out is None:
+                        errors_out = errors_path(output_path).open("w")
+                    errors_out.write(line)
+                else:
+                    out.write(line)
+                    out.flush()  # the row must be on disk before the key is marked done
+                    job.written_keys.add(row["key"])
+                    job.checkpoint.complete(row["key"])
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        for item in iter_lines(input_path):
+            await queue.put(item)
+        for _ in workers:
+            await queue.put(None)
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            if errors_out is not None:
+                errors_out.close()
+    return counts
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--task", required=True, help="Task description")
-    parser.add_argument("--candidate", required=True, help="Path to candidate output text file")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--task", help="Task description (batch: default for records without 'task')")
+    parser.add_argument("--candidate", help="Path to candidate output text file")
+    parser.add_argument("--candidate-b", help="Pairwise mode: path to the second candidate (compare A vs B)")
+    parser.add_argument("--batch", type=Path, help="JSONL file of candidates to judge concurrently")
+    parser.add_argument("--concurrency", type=int, default=8, help="Batch: concurrent evaluations")
+    parser.add_argument(
+        "--rate-limit", type=float, default=0.0, help="Batch: max judge calls started per second (cache hits are free)"
+    )
+    parser.add_argument("--checkpoint", type=Path, help="Batch: SQLite store of judged keys; enables resume")
+    parser.add_argument("--claim-timeout", type=float, default=600.0, help="Batch: seconds before a claim goes stale")
     parser.add_argument("--schema", type=Path, required=True, help="Judge output schema JSON file")
     parser.add_argument("--rubric", type=Path, help="Optional rubric JSON file with criterion weights")
-    parser.add_argument("--output", type=Path, default=Path("judge_result.json"))
+    parser.add_argument("--output", type=Path, help="Result file (default: judge_result.json / judge_results.jsonl)")
     parser.add_argument("--use-local-fallback", action="store_true")
+    parser.add_argument("--ensemble", type=int, help="Number of judges to vote (early stopping; uncached)")
+    parser.add_argument(
+        "--ensemble-weights", help="Comma-separated judge weights for a weighted vote (instead of --ensemble)"
+    )
+    parser.add_argument(
+        "--cache", type=Path, help="SQLite verdict cache for single external judge calls (ensemble/pairwise: unused)"
+    )
+    parser.add_argument("--cache-ttl", type=float, default=0.0, help="Cache entry lifetime in seconds (0 = forever)")
+    parser.add_argument("--cache-max-entries", type=int, default=100_000, help="Cache size before LRU eviction")
+    parser.add_argument(
+        "--validator-backend",
+        choices=VALIDATOR_BACKENDS,
+        default="auto",
+        help="Schema validation backend (auto: fastjsonschema if installed and $schema is draft-04/06/07, else jsonschema)",
+    )
     args = parser.parse_args()
 
+    if args.batch is None and (args.task is None or args.candidate is None):
+        parser.error("--task and --candidate are required unless --batch is given")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.ensemble is not None and args.ensemble_weights:
+        parser.error("--ensemble and --ensemble-weights are mutually exclusive (the weights set the judge count)")
+    if args.ensemble_weights:
+        try:
+            weights = [float(w) for w in args.ensemble_weights.split(",")]
+        except ValueError:
+            parser.error("--ensemble-weights must be comma-separated numbers")
+        if any(w <= 0 for w in weights):
+            parser.error("--ensemble-weights must be positive")
+    elif args.ensemble is None or args.ensemble >= 1:
+        weights = [1.0] * (args.ensemble or 1)
+    else:
+        parser.error("--ensemble must be at least 1")
+
     schema = load_json(args.schema)
     rubric = load_json(args.rubric) if args.rubric else DEFAULT_RUBRIC
-    candidate_text = Path(args.candidate).read_text()
-
-    result = asyncio.run(
-        evaluate(
-            task=args.task,
-            candidate_output=candidate_text,
-            schema=schema,
-            rubric=rubric,
-            use_local_fallback=args.use_local_fallback,
-        )
-    )
 
-    args.output.write_text(json.dumps(result, indent=2, ensure_ascii=True))
-    print(f"Judge result written to {args.output}")
+    cache = VerdictCache(args.cache, args.cache_ttl, args.cache_max_entries) if args.cache else None
+    if cache is not None and (len(weights) > 1 or args.candidate_b):
+        print("[WARN] --cache is not used for ensemble or pairwise judging; every judge call goes to the judge")
+    try:
+        if args.batch is not None:
+            run_batch_cli(args, schema, rubric, cache, weights)
+        elif len(weights) > 1 or args.candidate_b:
+            outcome = asyncio.run(
+                evaluate_ensemble(
+                    task=args.task,
+                    candidate_output=Path(args.candidate).read_text(),
+                    schema=schema,
+                    rubric=rubric,
+                    use_local_fallback=args.use_local_fallback,
+                    weights=weights,
+                    candidate_b=Path(args.candidate_b).read_text() if args.candidate_b else None,
+                    validator_backend=args.validator_backend,
+                )
+            )
+            meta = outcome["ensemble"]
+            output = args.output or Path("judge_result.json")
+            result = outcome if len(weights) > 1 else outcome["result"]
+            output.write_text(json.dumps(result, indent=2, ensure_ascii=True))
+            if len(weights) > 1:
+                print(
+                    f"Ensemble {meta['vote']}: {meta['decision']} {meta['votes']} - "
+                    f"{meta['responded']}/{meta['judges']} judge(s) responded, {meta['cancelled']} cancelled early"
+                )
+            print(f"Judge result written to {output}")
+        else:
+            result = asyncio.run(
+                evaluate(
+                    task=args.task,
+                    candidate_output=Path(args.candidate).read_text(),
+                    schema=schema,
+                    rubric=rubric,
+                    use_local_fallback=args.use_local_fallback,
+                    validator_backend=args.validator_backend,
+                    cache=cache,
+                )
+            )
+            output = args.output or Path("judge_result.json")
+            output.write_text(json.dumps(result, indent=2, ensure_ascii=True))
+            print(f"Judge result written to {output}")
+    finally:
+        if cache is not None:
+            print(f"Verdict cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+            cache.close()
+
+
+def run_batch_cli(
+    args: argparse.Namespace,
+    schema: dict[str, Any],
+    rubric: dict[str, float],
+    cache: VerdictCache | None,
+    weights: list[float],
+) -> None:
+    output = args.output or Path("judge_results.jsonl")
+    checkpoint = CheckpointStore(args.checkpoint, args.claim_timeout) if args.checkpoint else None
+    job = BatchJob(
+        schema=schema,
+        rubric=rubric,
+        use_local_fallback=args.use_local_fallback,
+        default_task=args.task,
+        validator_backend=args.validator_backend,
+        limiter=RateLimiter(args.rate_limit),
+        checkpoint=checkpoint,
+        cache=cache,
+        ensemble_weights=weights,
+    )
+    try:
+        counts = asyncio.run(run_batch(args.batch, output, job, args.concurrency))
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+    print(
+        f"Judged {counts['judged']} candidate(s), {counts['errors']} error(s), "
+        f"{counts['skipped']} already judged -> {output}"
+    )
+    if checkpoint is not None and counts["errors"]:
+        print(f"Errors (retried on the next run) written to {errors_path(output)}")
 
 
 if __name__ == "__main__":
@@ -9,18 +9,60 @@ from pathlib import Path
 CLIENT_TEMPLATE = """from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 
 import jsonschema
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
+try:  # optional, much faster validation backend
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+VALIDATOR_CACHE_SIZE = 32
+_validators: OrderedDict[str, Callable[[Any], None]] = OrderedDict()
+
 
 class TransientLLMError(Exception):
     pass
 
 
+def _compile_validator(schema: dict[str, Any]) -> Callable[[Any], None]:
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    # fastjsonschema only implements drafts 4, 6 and 7; anything else (or no $schema) stays on jsonschema.
+    declared = schema.get("$schema", "")
+    fast_ok = isinstance(declared, str) and any(d in declared for d in ("draft-04", "draft-06", "draft-07"))
+    if fastjsonschema is not None and fast_ok:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(instance: Any) -> None:
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaException as exc:
+                raise jsonschema.ValidationError(exc.message) from exc
+
+        return validate
+    return cls(schema).validate
+
+
+def get_validator(schema: dict[str, Any]) -> Callable[[Any], None]:
+    \"\"\"Compile each distinct schema once (keyed by schema hash, LRU-evicted) and reuse it.\"\"\"
+    key = hashlib.sha256(json.dumps(schema, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    validator = _validators.get(key)
+    if validator is None:
+        validator = _validators[key] = _compile_validator(schema)
+        if len(_validators) > VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    else:
+        _validators.move_to_end(key)
+    return validator
+
+
 class LLMTransport(Protocol):
     async def complete(self, prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
         ...
@@ -42,7 +84,7 @@ class AsyncStructuredLLMClient:
 
     async def run(self, prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
         result = await asyncio.wait_for(self._call_with_retry(prompt, schema), timeout=self.timeout_seconds)
-        jsonschema.validate(instance=result, schema=schema)
+        get_validator(schema)(result)
         return result
 """
 
@@ -128,7 +170,7 @@ async def run_batch(
     return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
 """
 
-REQUIREMENTS = "httpx==0.27.0\njsonschema==4.23.0\ntenacity==9.0.0\n"
+REQUIREMENTS = "httpx==0.27.0\njsonschema==4.23.0\ntenacity==9.0.0\n# optional, faster schema validation\n# fastjsonschema==2.20.0\n"
 
 
 def write(path: Path, content: str) -> None:
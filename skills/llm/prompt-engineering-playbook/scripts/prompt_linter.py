@@ -1,58 +1,878 @@
 #!/usr/bin/env python3
-"""Lint prompt templates for common quality and safety issues."""
+"""Lint prompt templates for common quality and safety issues.
+
+Accepts files, directories and glob patterns. Many files are linted in parallel over a
+process pool (`--jobs`) and summarized in one aggregated report (`--format text|json`,
+`--output`); `--fail-on` sets the exit-code threshold for pre-commit hooks. Rules are
+compiled once per process. Literal rules, and the literal text every match of a regex rule
+must contain, are matched together in one pass over each file (an Aho-Corasick automaton
+with the optional `pyahocorasick`, otherwise a trie-shaped regex), and a regex rule only
+runs on files where its literal occurs, so adding rules adds little scan time.
+
+Rules come from assets/prompt-lint-rules.json, an optional `--config` file in the same
+format and plugins registered under the `prompt_linter.rules` entry-point group. Each
+rule has a severity and a scope, and findings carry a line/column location. Rule run
+times are recorded (`--timings`); a rule exceeding the time budget is interrupted and
+disabled for the rest of the run. The file it was interrupted on gets a finding at the
+rule's severity saying it was not checked, and a disabled rule at or above `--fail-on`
+fails the run, since the files after it were not checked either.
+
+Length is measured in tokens: tiktoken when installed (`--tokenizer tiktoken:ENCODING`),
+a custom `module:function` counter, or a fast approximation. `--tokens` reports tokens
+per section, the static prefix before the first placeholder (what a provider can
+prompt-cache) and, with `--input-price` (`--cached-input-price`, `--output-price`), the
+estimated cost per call. Oversized templates and cache-unfriendly ones (a short static
+prefix) are flagged.
+
+With `--cache PATH` (off by default, so no file appears in the working directory),
+results are cached by file content hash and rule-set version and unchanged prompts are
+not linted again. `--changed-since REF` lints only files changed since a git ref
+(including uncommitted and untracked files).
+"""
 
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import importlib
+import json
+import os
 import re
+import signal
+import string
+import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from importlib.metadata import entry_points
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_RULES_FILE = Path(__file__).resolve().parent.parent / "assets" / "prompt-lint-rules.json"
+ENTRY_POINT_GROUP = "prompt_linter.rules"
+DEFAULT_TIME_BUDGET_MS = 250.0
+
+SEVERITIES = ("info", "warning", "error")
+TOKEN_KINDS = ("max_tokens", "cacheable_prefix")
+KINDS = ("required", "forbidden", "max_length", "custom", *TOKEN_KINDS)
+SCOPES = ("document", "line")
+# Timing keys for the single pass over all literal rules and for token counting.
+LITERAL_RULES_KEY = "(literal rules)"
+TOKENIZER_KEY = "(tokenizer)"
+
+DEFAULT_ENCODING = "o200k_base"
+# Template variables: {{ jinja }}, {% blocks %}, ${shell}, {format} and [bracketed] fill-ins.
+DEFAULT_PLACEHOLDER = r"\{\{.*?\}\}|\{%.*?%\}|\$\{[^}\n]*\}|\{[A-Za-z_][\w.]*\}|\[[^\]\n]+\](?!\()"
+# Providers only cache prompt prefixes of at least this many tokens.
+CACHE_MIN_TOKENS = 1024
+DROP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+HEADING = re.compile(r"^#{1,6}[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+
+CACHE_MAX_ENTRIES = 50_000
+
+PROMPT_SUFFIXES = {".md", ".txt", ".prompt", ".tmpl", ".j2", ".jinja", ".jinja2"}
+REGEX_METACHARS = set(".^$*+?{}[]\\|()")
+# Shorter required literals of a regex rule occur too often to be worth prefiltering on.
+PREFILTER_MIN_LENGTH = 3
+# Non-ASCII letters `re.IGNORECASE` equates with ASCII ones that str.lower() misses (or,
+# for U+0130, turns into two characters); folded before the literal pass.
+IGNORECASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None))
+
+
+class RuleConfigError(ValueError):
+    pass
+
+
+class RuleTimeout(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One lint rule.
+
+    `required`/`forbidden` rules match `pattern` (a regex); `max_length` flags text (or,
+    with line scope, lines) longer than `limit` characters; `max_tokens` flags text over
+    `limit` tokens; `cacheable_prefix` flags templates of at least `limit` static tokens
+    whose placeholders come early, leaving a prefix too short to be prompt-cached;
+    `custom` rules call `check(text)`, which returns character offsets of findings
+    (-1: no location). Line-scoped `forbidden` rules report every matching line.
+    """
+
+    id: str
+    message: str
+    kind: str = "forbidden"
+    pattern: str = ""
+    severity: str = "warning"
+    scope: str = "document"
+    ignore_case: bool = True
+    limit: int = 0
+    check: Callable[[str], Iterable[int]] | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Rule:
+        unknown = set(data) - {f.name for f in fields(cls)}
+        if unknown:
+            raise RuleConfigError(f"rule {data.get('id', '?')}: unknown keys {sorted(unknown)}")
+        try:
+            rule = cls(**data)
+        except TypeError as exc:
+            raise RuleConfigError(f"rule {data.get('id', '?')}: {exc}") from exc
+        rule.validate()
+        return rule
+
+    def validate(self) -> None:
+        problems = []
+        if self.kind not in KINDS:
+            problems.append(f"kind must be one of {KINDS}")
+        if self.severity not in SEVERITIES:
+            problems.append(f"severity must be one of {SEVERITIES}")
+        if self.scope not in SCOPES:
+            problems.append(f"scope must be one of {SCOPES}")
+        if self.kind in ("required", "forbidden"):
+            if not self.pattern:
+                problems.append("pattern is required")
+            try:
+                re.compile(self.pattern)
+            except re.error as exc:
+                problems.append(f"invalid pattern: {exc}")
+        if self.kind in ("required", *TOKEN_KINDS) and self.scope != "document":
+            problems.append(f"{self.kind} rules must use document scope")
+        if self.kind in ("max_length", *TOKEN_KINDS) and self.limit <= 0:
+            problems.append(f"{self.kind} rules need a positive limit")
+        if self.kind == "custom" and not callable(self.check):
+            problems.append("custom rules need a callable check")
+        if problems:
+            raise RuleConfigError(f"rule {self.id}: " + "; ".join(problems))
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    severity: str
+    message: str
+    line: int | None = None
+    column: int | None = None
+
+
+def trie_pattern(literals: list[str]) -> str:
+    """One regex for many literals with shared prefixes factored out, so `re` follows a
+    single path per position instead of trying every literal. Literal i ends with the
+    empty group `l<i>`; a literal that is a prefix of another closes its group first."""
+    trie: dict[str, dict] = {}
+    for i, literal in enumerate(literals):
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node.setdefault("", i)
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")" if branches else ""
+        if "" not in node:
+            return body
+        return f"(?P<l{node['']}>)" + (f"(?:{body})?" if body else "")
+
+    return build(trie)
+
+
+class Matcher:
+    """All literals compiled once; `find` returns the indexes of those present in a text.
+
+    Literals go into one Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    into one trie-shaped regex (trie_pattern). Either way the text is scanned once, and
+    the scan barely slows down as literals are added; a flat `a|b|c` alternation would
+    try every literal at every position instead.
+    """
+
+    def __init__(self, literals: list[str]) -> None:
+        self.literals = literals
+        unique = list(dict.fromkeys(literal for literal in literals if literal))
+        self.indexes = {literal: [i for i, other in enumerate(literals) if other == literal] for literal in unique}
+        self.automaton = self.pattern = None
+        if not unique:
+            return
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for literal in unique:
+                self.automaton.add_word(literal, literal)
+            self.automaton.make_automaton()
+            return
+        # A match reports the longest literal starting at its position; the shorter
+        # literals along the same path (its prefixes) are present there too.
+        self.pattern = re.compile("(?=" + trie_pattern(unique) + ")")
+        self.by_group = {}
+        for name, group in self.pattern.groupindex.items():
+            literal = unique[int(name[1:])]
+            self.by_group[group] = [i for prefix in unique if literal.startswith(prefix) for i in self.indexes[prefix]]
+
+    def find(self, text: str) -> set[int]:
+        if self.automaton is not None:
+            return {i for _, literal in self.automaton.iter(text) for i in self.indexes[literal]}
+        if self.pattern is None:
+            return set()
+        found: set[int] = set()
+        for match in self.pattern.finditer(text):
+            found.update(self.by_group[match.lastindex])
+        return found
+
+
+def required_literals(pattern: str, flags: int = 0) -> list[str] | None:
+    """Lowercased literals of which every match of `pattern` contains at least one, or None.
+
+    Derived from the parsed pattern: a run of plain ASCII characters in the top-level
+    sequence, inside a group or a repeat of at least one, or one such literal per branch
+    of an alternation. Used to skip regex rules on texts that cannot match them."""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, OverflowError, RecursionError):
+        return None
+
+    def sequence(items) -> list[str] | None:
+        candidates: list[list[str]] = []
+        run: list[str] = []
+        for op, av in items:
+            if op is sre_parse.LITERAL and av < 128:
+                run.append(chr(av))
+                continue
+            if len(run) >= PREFILTER_MIN_LENGTH:
+                candidates.append(["".join(run).lower()])
+            run = []
+            found = None
+            if op is sre_parse.SUBPATTERN:
+                found = sequence(av[-1])
+            elif op in REPEATS and av[0] >= 1:
+                found = sequence(av[2])
+            elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+                found = sequence(av)
+            elif op is sre_parse.BRANCH:
+                branches = [sequence(branch) for branch in av[1]]
+                if all(branches):
+                    found = [literal for branch in branches for literal in branch]
+            if found:
+                candidates.append(found)
+        if len(run) >= PREFILTER_MIN_LENGTH:
+            candidates.append(["".join(run).lower()])
+        # Prefer the set whose shortest literal is longest: it is the rarest to occur.
+        return max(candidates, key=lambda found: (min(map(len, found)), -len(found)), default=None)
+
+    return sequence(parsed)
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise RuleTimeout
+
+
+@contextmanager
+def hard_time_limit(seconds: float) -> Iterator[bool]:
+    """Interrupt the block with RuleTimeout after `seconds` using SIGALRM.
+
+    Yields False (and enforces nothing) where interval timers are unavailable: on
+    Windows and outside the main thread. The regex engine checks for signals while
+    matching, so even catastrophic backtracking is interrupted.
+    """
+    if seconds <= 0 or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield False
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield True
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def approx_token_count(text: str) -> int:
+    """Words plus punctuation marks, or a quarter of the characters when that is more."""
+    punctuation = len(text) - len(text.translate(DROP_PUNCTUATION))
+    return max(len(text.split()) + punctuation, -(-len(text) // 4))
+
+
+def load_tokenizer(spec: str = "auto") -> tuple[str, Callable[[str], int]]:
+    """Resolve `auto`, `approx`, `tiktoken[:ENCODING]` or `module:function` to (name, counter).
+
+    `auto` uses tiktoken when it is installed and its encoding is available locally,
+    and the approximation otherwise.
+    """
+    if spec == "approx":
+        return "approx", approx_token_count
+    if spec == "auto" or spec.split(":")[0] == "tiktoken":
+        encoding_name = spec.partition(":")[2] or DEFAULT_ENCODING
+        try:
+            if tiktoken is None:
+                raise RuleConfigError("tiktoken is not installed")
+            encoding = tiktoken.get_encoding(encoding_name)
+        except Exception as exc:  # unknown encoding, or BPE file not cached and no network
+            if spec == "auto":
+                return "approx", approx_token_count
+            raise RuleConfigError(f"tokenizer {spec}: {exc}") from exc
+        return f"tiktoken:{encoding_name}", lambda text: len(encoding.encode(text, disallowed_special=()))
+    module, _, name = spec.partition(":")
+    try:
+        counter = getattr(importlib.import_module(module), name)
+    except (ImportError, AttributeError, ValueError) as exc:
+        expected = "auto, approx, tiktoken[:ENCODING] or module:function"
+        raise RuleConfigError(f"tokenizer {spec}: expected {expected}") from exc
+    return spec, counter
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """(title, body) per markdown heading; text before the first heading is the preamble."""
+    marks = [(m.start(), m.group(1)) for m in HEADING.finditer(text)]
+    if not marks or (marks[0][0] > 0 and text[: marks[0][0]].strip()):
+        marks.insert(0, (0, "(preamble)"))
+    ends = [start for start, _ in marks[1:]] + [len(text)]
+    return [(title, text[start:end]) for (start, title), end in zip(marks, ends)]
+
+
+def analyze_tokens(
+    text: str, count: Callable[[str], int], placeholder: re.Pattern[str], sections: bool = False
+) -> dict[str, Any]:
+    first = placeholder.search(text)
+    total = count(text)
+    analysis = {
+        "total": total,
+        "static_prefix": count(text[: first.start()]) if first else total,
+        "static": count(placeholder.sub("", text)) if first else total,
+        "placeholders": sum(1 for _ in placeholder.finditer(text)) if first else 0,
+        "first_placeholder": first.start() if first else -1,
+    }
+    if sections:
+        analysis["sections"] = [{"title": title, "tokens": count(body)} for title, body in split_sections(text)]
+    return analysis
 
-REQUIRED_HINTS = [
-    ("output", "Missing explicit output instructions"),
-    ("json", "Missing machine-readable output constraint (for structured tasks)"),
-]
 
-ANTI_PATTERNS = [
-    (r"everything", "Vague scope: avoid words like 'everything'"),
-    (r"as much as possible", "Unbounded output request"),
-    (r"ignore previous", "Potential prompt injection keyword"),
-]
+def estimate_cost(analysis: dict[str, Any], prices: dict[str, float]) -> float:
+    """USD per call, assuming the static prefix is served from the prompt cache when long enough."""
+    cached = analysis["static_prefix"] if analysis["static_prefix"] >= prices["cache_min_tokens"] else 0
+    return (
+        (analysis["total"] - cached) * prices["input"]
+        + cached * prices["cached_input"]
+        + prices["output_tokens"] * prices["output"]
+    ) / 1_000_000
+
+
+def offset_location(text: str, offset: int) -> tuple[int | None, int | None]:
+    if offset < 0:
+        return None, None
+    return text.count("\n", 0, offset) + 1, offset - text.rfind("\n", 0, offset)
+
+
+def line_spans(text: str) -> Iterator[tuple[int, str]]:
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        yield offset, line.rstrip("\r\n")
+        offset += len(line)
+
+
+class RuleEngine:
+    """Evaluates rules against texts and keeps per-rule timings.
+
+    Literal, case-insensitive document rules, and the required literals of regex rules,
+    are evaluated together in one Matcher pass (timed as LITERAL_RULES_KEY). A regex rule
+    whose required literals are all absent is decided by that pass alone; every other rule
+    runs and is timed on its own under the time budget. Tokens are counted once per text
+    (TOKENIZER_KEY) when a token rule or the token report needs them.
+    """
+
+    def __init__(
+        self,
+        rules: list[Rule],
+        time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
+        tokenizer: str = "auto",
+        placeholder: str = DEFAULT_PLACEHOLDER,
+        token_report: bool = False,
+    ) -> None:
+        self.rules = rules
+        self.time_budget_ms = time_budget_ms
+        self.disabled: dict[str, str] = {}
+        self.last_timings: dict[str, float] = {}
+        self.tokenizer, self.count_tokens = load_tokenizer(tokenizer)
+        try:
+            self.placeholder = re.compile(placeholder, re.DOTALL)
+        except re.error as exc:
+            raise RuleConfigError(f"invalid placeholder pattern: {exc}") from exc
+        self.token_report = token_report
+        self.needs_tokens = token_report or any(rule.kind in TOKEN_KINDS for rule in rules)
+        self.last_analysis: dict[str, Any] | None = None
+
+        def literal(rule: Rule) -> bool:
+            return (
+                rule.kind in ("required", "forbidden")
+                and rule.scope == "document"
+                and rule.ignore_case
+                and not REGEX_METACHARS & set(rule.pattern)
+            )
+
+        self.literal_rules = [rule for rule in rules if literal(rule)]
+        self.other_rules = [rule for rule in rules if not literal(rule)]
+        literals = [rule.pattern.lower() for rule in self.literal_rules]
+        self.patterns = {}
+        self.prefilters: dict[str, set[int]] = {}
+        for rule in self.other_rules:
+            if rule.kind not in ("required", "forbidden"):
+                continue
+            flags = re.IGNORECASE if rule.ignore_case else 0
+            self.patterns[rule.id] = re.compile(rule.pattern, flags)
+            required = required_literals(rule.pattern, flags)
+            if required:
+                self.prefilters[rule.id] = set(range(len(literals), len(literals) + len(required)))
+                literals += required
+        self.matcher = Matcher(literals)
+
+    def run_rule(self, rule: Rule, text: str) -> list[int]:
+        if rule.kind == "custom":
+            return list(rule.check(text))
+        if rule.kind == "max_tokens":
+            return [-1] if self.last_analysis["total"] > rule.limit else []
+        if rule.kind == "cacheable_prefix":
+            analysis = self.last_analysis
+            late = analysis["static"] >= rule.limit > analysis["static_prefix"]
+            return [analysis["first_placeholder"]] if late else []
+        if rule.kind == "max_length":
+            if rule.scope == "line":
+                return [start + rule.limit for start, line in line_spans(text) if len(line) > rule.limit]
+            return [rule.limit] if len(text) > rule.limit else []
+        pattern = self.patterns[rule.id]
+        if rule.kind == "required":
+            return [] if pattern.search(text) else [-1]
+        if rule.scope == "line":
+            return [start + m.start() for start, line in line_spans(text) if (m := pattern.search(line))]
+        match = pattern.search(text)
+        return [match.start()] if match else []
+
+    def lint(self, text: str) -> list[Finding]:
+        offsets: dict[str, list[int]] = {}
+        self.last_timings = {}
+
+        found: set[int] = set()
+        if self.matcher.literals:
+            started = time.perf_counter()
+            lowered = (text if text.isascii() else text.translate(IGNORECASE_FOLD)).lower()
+            found = self.matcher.find(lowered)
+            for i, rule in enumerate(self.literal_rules):
+                if rule.kind == "required" and i not in found:
+                    offsets[rule.id] = [-1]
+                elif rule.kind == "forbidden" and i in found:
+                    offsets[rule.id] = [lowered.find(rule.pattern.lower())]
+            self.last_timings[LITERAL_RULES_KEY] = (time.perf_counter() - started) * 1000
+
+        self.last_analysis = None
+        if self.needs_tokens:
+            started = time.perf_counter()
+            self.last_analysis = analyze_tokens(text, self.count_tokens, self.placeholder, self.token_report)
+            self.last_timings[TOKENIZER_KEY] = (time.perf_counter() - started) * 1000
+
+        budget = self.time_budget_ms / 1000
+        unchecked: list[Finding] = []
+        for rule in self.other_rules:
+            if rule.id in self.disabled:
+                continue
+            if rule.id in self.prefilters and not self.prefilters[rule.id] & found:
+                # None of the literals every match contains occurs: the rule cannot match.
+                if rule.kind == "required":
+                    offsets[rule.id] = [-1]
+                continue
+            started = time.perf_counter()
+            enforced = False
+            try:
+                # Length checks are linear in the text; only patterns and plugins need the timer.
+                capped = rule.kind not in ("max_length", *TOKEN_KINDS)
+                with hard_time_limit(budget if capped else 0) as enforced:
+                    offsets[rule.id] = self.run_rule(rule, text)
+            except RuleTimeout:
+                self.disabled[rule.id] = reason = f"interrupted after the {self.time_budget_ms:g} ms budget"
+                unchecked.append(Finding(rule.id, rule.severity, f"rule {rule.id} not checked: {reason}"))
+            elapsed = (time.perf_counter() - started) * 1000
+            self.last_timings[rule.id] = elapsed
+            if not enforced and budget > 0 and elapsed > self.time_budget_ms:
+                # No timer to interrupt it here: drop the rule once it has been slow.
+                self.disabled[rule.id] = f"took {elapsed:.0f} ms, over the {self.time_budget_ms:g} ms budget"
+
+        findings = []
+        for rule in self.rules:  # report in rule order
+            for offset in offsets.get(rule.id, ()):
+                line, column = offset_location(text, offset)
+                findings.append(Finding(rule.id, rule.severity, rule.message, line, column))
+        return findings + unchecked
+
+
+def read_rules_file(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError) as exc:
+        raise RuleConfigError(f"cannot read rules from {path}: {exc}") from exc
+    if not isinstance(data, dict) or not isinstance(data.get("rules", []), list):
+        raise RuleConfigError(f"{path}: expected an object with a 'rules' list")
+    return data
+
+
+def plugin_rules() -> list[Rule]:
+    """Rules of installed plugins. An entry point loads a list of rule dicts (or Rules),
+    or a callable returning one."""
+    rules = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        provided = entry_point.load()
+        if callable(provided):
+            provided = provided()
+        rules.extend(item if isinstance(item, Rule) else Rule.from_dict(item) for item in provided)
+    return rules
+
+
+def load_rules(config: Path | None = None, plugins: bool = True) -> tuple[list[Rule], float]:
+    """Defaults (unless the config sets `include_defaults: false`), config rules, then
+    plugin rules; a later rule replaces an earlier one with the same id."""
+    defaults = read_rules_file(DEFAULT_RULES_FILE)
+    data = read_rules_file(config) if config else {}
+    specs = (defaults["rules"] if data.get("include_defaults", True) else []) + data.get("rules", [])
+    rules = [Rule.from_dict(spec) for spec in specs]
+    if plugins:
+        rules += plugin_rules()
+    disabled = set(data.get("disable", []))
+    by_id = {rule.id: rule for rule in rules if rule.id not in disabled}
+    budget = data.get("time_budget_ms", defaults.get("time_budget_ms", DEFAULT_TIME_BUDGET_MS))
+    return list(by_id.values()), float(budget)
+
+
+_engine: RuleEngine | None = None
+
+
+def init_engine(
+    config: Path | None = None,
+    plugins: bool = True,
+    time_budget_ms: float | None = None,
+    tokenizer: str = "auto",
+    placeholder: str = DEFAULT_PLACEHOLDER,
+    token_report: bool = False,
+) -> RuleEngine:
+    global _engine
+    rules, budget = load_rules(config, plugins)
+    budget = budget if time_budget_ms is None else time_budget_ms
+    _engine = RuleEngine(rules, budget, tokenizer, placeholder, token_report)
+    return _engine
+
+
+def get_engine() -> RuleEngine:
+    return _engine if _engine is not None else init_engine()
 
 
 def lint_prompt(text: str) -> list[str]:
-    issues: list[str] = []
-    lowered = text.lower()
+    return [finding.message for finding in get_engine().lint(text)]
+
+
+def ruleset_version(engine: RuleEngine) -> str:
+    """Hash of everything that decides a file's findings: linter source, rules, tokenizer."""
+    rules = []
+    for rule in engine.rules:
+        spec = {f.name: getattr(rule, f.name) for f in fields(rule)}
+        if rule.check is not None:
+            spec["check"] = f"{rule.check.__module__}.{rule.check.__qualname__}"
+        rules.append(spec)
+    settings = [rules, engine.tokenizer, engine.placeholder.pattern]
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def load_cache(path: Path, version: str) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    return data.get("entries", {})
+
+
+def save_cache(path: Path, version: str, entries: dict[str, dict]) -> None:
+    while len(entries) > CACHE_MAX_ENTRIES:  # oldest first: hits are re-inserted at the end
+        del entries[next(iter(entries))]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": version, "entries": entries}, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def changed_files(ref: str, cwd: Path) -> set[Path]:
+    """Files of the repository containing `cwd` changed since `ref` (committed, staged or
+    not) plus untracked ones, as resolved paths."""
+
+    def git(*args: str) -> list[str]:
+        proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"git {' '.join(args)} failed: {proc.stderr.strip()}")
+        return proc.stdout.splitlines()
+
+    top = Path(git("rev-parse", "--show-toplevel")[0])
+    names = git("diff", "--name-only", "--diff-filter=d", ref) + git("ls-files", "--others", "--exclude-standard")
+    return {(top / name).resolve() for name in names}
+
 
-    for token, message in REQUIRED_HINTS:
-        if token not in lowered:
-            issues.append(message)
+def collect_files(inputs: list[str]) -> list[Path]:
+    """Expand files, directories (recursively, prompt-like suffixes) and glob patterns."""
+    files: dict[Path, None] = {}
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.suffix in PROMPT_SUFFIXES and p.is_file())
+        elif path.exists() or not glob.has_magic(item):
+            matches = [path]
+        else:
+            matches = sorted(Path(p) for p in glob.glob(item, recursive=True) if Path(p).is_file())
+        files.update(dict.fromkeys(matches))
+    return list(files)
 
-    for pattern, message in ANTI_PATTERNS:
-        if re.search(pattern, lowered):
-            issues.append(message)
 
-    if len(text) > 7000:
-        issues.append("Prompt is very long; reduce context to improve consistency")
+def lint_file(path: Path) -> dict:
+    engine = get_engine()
+    try:
+        findings = [asdict(finding) for finding in engine.lint(path.read_text())]
+    except (OSError, UnicodeDecodeError) as exc:
+        return {"path": str(path), "findings": [], "error": str(exc), "timings": {}, "disabled": {}}
+    # A snapshot: the rules this file was not fully checked against, not ones disabled on later files.
+    disabled = dict(engine.disabled)
+    result = {"path": str(path), "findings": findings, "timings": engine.last_timings, "disabled": disabled}
+    if engine.token_report:
+        result["tokens"] = engine.last_analysis
+    return result
 
-    return issues
 
+def lint_files(files: list[Path], jobs: int, engine_args: tuple) -> list[dict]:
+    if len(files) > 1 and jobs > 1:
+        workers = min(jobs, len(files))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_engine, initargs=engine_args) as pool:
+            return list(pool.map(lint_file, files, chunksize=max(1, len(files) // (workers * 8))))
+    return [lint_file(path) for path in files]
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("file", type=Path, help="Prompt file path")
+
+def build_report(results: list[dict], prices: dict[str, float] | None = None) -> dict:
+    timings: dict[str, dict[str, float]] = {}
+    disabled: dict[str, str] = {}
+    for result in results:
+        for rule_id, elapsed in result.pop("timings").items():
+            stats = timings.setdefault(rule_id, {"total_ms": 0.0, "max_ms": 0.0, "runs": 0})
+            stats["total_ms"] += elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+            stats["runs"] += 1
+        disabled.update(result.pop("disabled"))
+    for stats in timings.values():
+        stats["total_ms"], stats["max_ms"] = round(stats["total_ms"], 3), round(stats["max_ms"], 3)
+
+    findings = [finding for result in results for finding in result["findings"]]
+    report = {
+        "files": len(results),
+        "with_findings": sum(1 for result in results if result["findings"]),
+        "errors": sum(1 for result in results if "error" in result),
+        "cached": sum(1 for result in results if result.get("cached")),
+        "severity_counts": dict(Counter(finding["severity"] for finding in findings)),
+        "rule_counts": dict(Counter(finding["rule"] for finding in findings).most_common()),
+        "disabled_rules": disabled,
+        "timings": dict(sorted(timings.items(), key=lambda item: -item[1]["total_ms"])),
+        "results": results,
+    }
+    analyses = [result["tokens"] for result in results if result.get("tokens")]
+    if analyses:
+        if prices:
+            for analysis in analyses:
+                analysis["cost_per_call"] = round(estimate_cost(analysis, prices), 8)
+        report["tokens"] = {
+            "tokenizer": get_engine().tokenizer,
+            "total": sum(analysis["total"] for analysis in analyses),
+            "max": max(analysis["total"] for analysis in analyses),
+            "static_prefix_total": sum(analysis["static_prefix"] for analysis in analyses),
+        }
+        if prices:
+            report["tokens"]["cost_per_call_total"] = round(sum(a["cost_per_call"] for a in analyses), 8)
+    return report
+
+
+def describe_tokens(analysis: dict[str, Any]) -> str:
+    line = f"{analysis['total']} tokens, static prefix {analysis['static_prefix']}"
+    if analysis["placeholders"]:
+        line += f" (first of {analysis['placeholders']} placeholder(s) at char {analysis['first_placeholder']})"
+    if "cost_per_call" in analysis:
+        line += f", ~${analysis['cost_per_call']:.6f}/call"
+    return line
+
+
+def describe(finding: dict) -> str:
+    location = f" ({finding['line']}:{finding['column']})" if finding["line"] is not None else ""
+    return f"[{finding['severity']}] {finding['message']}{location}"
+
+
+def render_text(report: dict, show_timings: bool = False) -> str:
+    results = report["results"]
+    lines = []
+    if len(results) == 1 and "error" not in results[0]:
+        findings = results[0]["findings"]
+        if not findings:
+            lines.append("Prompt lint: OK")
+        else:
+            lines.append("Prompt lint issues:")
+            lines.extend(f"- {describe(finding)}" for finding in findings)
+        if results[0].get("tokens"):
+            analysis = results[0]["tokens"]
+            lines.append(f"Tokens ({report['tokens']['tokenizer']}): {describe_tokens(analysis)}")
+            lines.extend(f"  {section['tokens']:>7}  {section['title']}" for section in analysis.get("sections", []))
+    else:
+        for result in results:
+            if "error" in result:
+                lines.append(f"  [ERROR] {result['path']}: {result['error']}")
+                continue
+            if result["findings"]:
+                lines.append(f"  [issues] {result['path']}")
+                lines.extend(f"    - {describe(finding)}" for finding in result["findings"])
+            if result.get("tokens"):
+                lines.append(f"  [tokens] {result['path']}: {describe_tokens(result['tokens'])}")
+        lines.append(
+            f"Linted {report['files']} file(s) ({report['cached']} cached): "
+            f"{report['with_findings']} with issues, {report['errors']} unreadable"
+        )
+        lines.extend(f"  {count:>6}  {rule_id}" for rule_id, count in report["rule_counts"].items())
+        if "tokens" in report:
+            totals = report["tokens"]
+            line = f"Tokens ({totals['tokenizer']}): {totals['total']} total, largest file {totals['max']}"
+            if "cost_per_call_total" in totals:
+                line += f", ~${totals['cost_per_call_total']:.4f} for one call per template"
+            lines.append(line)
+    for rule_id, reason in report["disabled_rules"].items():
+        lines.append(f"  [disabled] {rule_id}: {reason}")
+    if show_timings:
+        lines.append("Rule timings (slowest first):")
+        lines.extend(
+            f"  {stats['total_ms']:>10.3f} ms total  {stats['max_ms']:>9.3f} ms max  {rule_id}"
+            for rule_id, stats in report["timings"].items()
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Prompt files, directories or glob patterns")
+    parser.add_argument("--config", type=Path, help="Rules JSON file (format of assets/prompt-lint-rules.json)")
+    parser.add_argument("--no-plugins", action="store_true", help=f"Ignore '{ENTRY_POINT_GROUP}' entry points")
+    parser.add_argument("--time-budget-ms", type=float, help="Per-rule, per-file time limit (0 disables it)")
+    parser.add_argument("--timings", action="store_true", help="Print per-rule execution times")
+    parser.add_argument(
+        "--tokenizer", default="auto", help="auto, approx, tiktoken[:ENCODING] or module:function counting tokens"
+    )
+    parser.add_argument("--tokens", action="store_true", help="Report tokens per file and section, static prefix")
+    parser.add_argument("--placeholder", default=DEFAULT_PLACEHOLDER, help="Regex matching template variables")
+    parser.add_argument("--input-price", type=float, default=0.0, help="USD per 1M input tokens (enables cost)")
+    parser.add_argument("--cached-input-price", type=float, help="USD per 1M cached input tokens (default: input)")
+    parser.add_argument("--output-price", type=float, default=0.0, help="USD per 1M output tokens")
+    parser.add_argument("--output-tokens", type=int, default=0, help="Expected output tokens per call")
+    parser.add_argument("--cache-min-tokens", type=int, default=CACHE_MIN_TOKENS, help="Shortest cacheable prefix")
+    parser.add_argument(
+        "--fail-on", choices=(*SEVERITIES, "never"), default="error", help="Exit 1 on findings of this severity or up"
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--cache", type=Path, help="Lint result cache file (opt-in, e.g. .cache/prompt_lint.json)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore --cache and lint every file")
+    parser.add_argument("--changed-since", metavar="REF", help="Only lint files changed since this git ref")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Report format")
+    parser.add_argument("--output", type=Path, help="Write the report to a file instead of stdout")
     args = parser.parse_args()
 
-    text = args.file.read_text()
-    issues = lint_prompt(text)
+    files = collect_files(args.paths)
+    if not files:
+        parser.error("no prompt files matched")
+    if args.changed_since:
+        try:
+            changed = changed_files(args.changed_since, files[0].resolve().parent)
+        except (OSError, RuntimeError) as exc:
+            parser.error(str(exc))
+        files = [path for path in files if path.resolve() in changed]
+        if not files:
+            print(f"Prompt lint: no prompt files changed since {args.changed_since}")
+            return 0
+    engine_args = (args.config, not args.no_plugins, args.time_budget_ms, args.tokenizer, args.placeholder, args.tokens)
+    try:
+        engine = init_engine(*engine_args)  # fail fast on a broken config, before any worker starts
+    except RuleConfigError as exc:
+        parser.error(str(exc))
 
-    if not issues:
-        print("Prompt lint: OK")
-        return
+    version = ruleset_version(engine)
+    use_cache = args.cache is not None and not args.no_cache
+    cache = load_cache(args.cache, version) if use_cache else {}
+    hashes: dict[Path, str | None] = {}
+    for path in files:
+        try:
+            hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            hashes[path] = None
+    # Entries written without --tokens cannot serve a run that reports tokens.
+    pending = [
+        path for path in files if hashes[path] not in cache or (args.tokens and "tokens" not in cache[hashes[path]])
+    ]
+    fresh = dict(zip(pending, lint_files(pending, args.jobs, engine_args)))
+
+    results = []
+    for path in files:
+        key = hashes[path]
+        if path in fresh:
+            result = fresh[path]
+            # Results of a run that disabled a slow rule are incomplete; never cache them.
+            if key is not None and "error" not in result and not result["disabled"]:
+                cache[key] = {"findings": result["findings"]}
+                if "tokens" in result:
+                    cache[key]["tokens"] = dict(result["tokens"])
+        else:
+            entry = cache.pop(key)
+            cache[key] = entry  # mark as recently used
+            result = {"path": str(path), "findings": entry["findings"], "timings": {}, "disabled": {}, "cached": True}
+            if args.tokens:
+                result["tokens"] = dict(entry["tokens"])
+        results.append(result)
+    if use_cache:
+        save_cache(args.cache, version, cache)
+
+    prices = None
+    if args.input_price > 0:
+        prices = {
+            "input": args.input_price,
+            "cached_input": args.input_price if args.cached_input_price is None else args.cached_input_price,
+            "output": args.output_price,
+            "output_tokens": args.output_tokens,
+            "cache_min_tokens": args.cache_min_tokens,
+        }
+    report = build_report(results, prices)
+    text = json.dumps(report, indent=2) + "\n" if args.format == "json" else render_text(report, args.timings)
+    if args.output:
+        args.output.write_text(text)
+        print(f"Lint report for {report['files']} file(s) written to {args.output}")
+    else:
+        print(text, end="")
 
-    print("Prompt lint issues:")
-    for issue in issues:
-        print(f"- {issue}")
+    if args.fail_on == "never":
+        return 0
+    threshold = SEVERITIES.index(args.fail_on)
+    # A disabled rule was skipped for every later file, so its severity counts as if it had fired.
+    severity_of = {rule.id: rule.severity for rule in engine.rules}
+    severities = [*report["severity_counts"], *(severity_of[rule_id] for rule_id in report["disabled_rules"])]
+    return 1 if any(SEVERITIES.index(severity) >= threshold for severity in severities) else 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())